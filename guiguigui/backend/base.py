@@ -1,7 +1,8 @@
 from __future__ import annotations
 
+import time
 from abc import ABC, abstractmethod
-from collections.abc import Callable
+from collections.abc import Callable, Sequence
 from typing import Any
 
 from ..core.types import (
@@ -18,6 +19,9 @@ from ..core.types import (
 
 
 class Backend(ABC):
+    # Window in which a repeated move to the same target is dropped; 0 posts every move
+    move_coalesce_interval: float = 0.0
+
     @abstractmethod
     def mouse_position(self) -> Point:
         pass
@@ -30,6 +34,10 @@ class Backend(ABC):
     def mouse_move_rel(self, dx: int, dy: int) -> None:
         pass
 
+    def mouse_move_and_position(self, x: int, y: int) -> Point:
+        self.mouse_move_to(x, y)
+        return self.mouse_position()
+
     @abstractmethod
     def mouse_press(self, button: MouseButton) -> None:
         pass
@@ -54,14 +62,38 @@ class Backend(ABC):
     def key_release(self, key: Key | str) -> None:
         pass
 
+    def key_press_batch(self, keys: Sequence[Key | str]) -> None:
+        for key in keys:
+            self.key_press(key)
+
+    def key_release_batch(self, keys: Sequence[Key | str]) -> None:
+        for key in keys:
+            self.key_release(key)
+
+    def key_tap_sequence(self, keys: Sequence[Key | str]) -> None:
+        for key in keys:
+            self.key_press(key)
+            self.key_release(key)
+
     @abstractmethod
     def key_is_pressed(self, key: Key | str) -> bool:
         pass
 
+    def key_states(self, keys: Sequence[Key | str]) -> list[bool]:
+        return [self.key_is_pressed(key) for key in keys]
+
     @abstractmethod
     def key_type_unicode(self, text: str) -> None:
         pass
 
+    def key_type_batch(self, text: str, interval: float = 0.0) -> None:
+        if interval <= 0:
+            self.key_type_unicode(text)
+            return
+        for char in text:
+            self.key_type_unicode(char)
+            time.sleep(interval)
+
     @abstractmethod
     def get_keyboard_layout(self) -> str:
         pass
@@ -90,6 +122,10 @@ class Backend(ABC):
     def get_window_at(self, x: int, y: int) -> WindowInfo | None:
         pass
 
+    def get_window_at_pointer(self) -> WindowInfo | None:
+        pos = self.mouse_position()
+        return self.get_window_at(pos.x, pos.y)
+
     @abstractmethod
     def focus_window(self, handle: Any) -> None:
         pass
@@ -147,6 +183,15 @@ class Backend(ABC):
     def unhook(self, hook_handle: Any) -> None:
         raise NotImplementedError("Hook not supported on this platform")
 
+    def sync(self) -> None:
+        # Wait until injected input has been processed; backends without a request queue
+        # have nothing to wait for
+        return None
+
+    def close(self) -> None:
+        # Release OS registrations held by the backend; most backends hold none
+        return None
+
     @abstractmethod
     def check_permissions(self) -> dict[str, bool]:
         pass
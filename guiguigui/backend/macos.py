@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import time
+from dataclasses import replace
 from typing import Any
 
 from ..core.errors import BackendCapabilityError
@@ -10,10 +11,11 @@ from .base import Backend
 try:
     import Quartz
     from Cocoa import (
-        NSApplicationActivationPolicyRegular,
+        NSApplicationActivateIgnoringOtherApps,
         NSPasteboard,
+        NSPasteboardTypeString,
+        NSRunningApplication,
         NSScreen,
-        NSStringPboardType,
         NSWorkspace,
     )
     from Quartz import (
@@ -22,9 +24,16 @@ try:
         CGEventCreateKeyboardEvent,
         CGEventCreateMouseEvent,
         CGEventGetLocation,
+        CGEventKeyboardSetUnicodeString,
         CGEventPost,
+        CGEventSetFlags,
+        CGEventSetTimestamp,
+        CGEventSourceButtonState,
+        CGEventSourceCreate,
+        CGEventSourceFlagsState,
         CGMainDisplayID,
         CGWindowListCopyWindowInfo,
+        kCGEventFlagMaskShift,
         kCGEventLeftMouseDown,
         kCGEventLeftMouseUp,
         kCGEventMouseMoved,
@@ -33,6 +42,7 @@ try:
         kCGEventRightMouseDown,
         kCGEventRightMouseUp,
         kCGEventScrollWheel,
+        kCGEventSourceStateHIDSystemState,
         kCGHIDEventTap,
         kCGMouseButtonCenter,
         kCGMouseButtonLeft,
@@ -46,220 +56,273 @@ except ImportError as e:
         "PyObjC is required for macOS backend. Install with: pip install pyobjc-core pyobjc-framework-Quartz pyobjc-framework-Cocoa"
     ) from e
 
+# CGWindowList dictionary keys, read individually via objectForKey_
+_K_OWNER_NAME = "kCGWindowOwnerName"
+_K_NAME = "kCGWindowName"
+_K_NUMBER = "kCGWindowNumber"
+_K_OWNER_PID = "kCGWindowOwnerPID"
+_K_BOUNDS = "kCGWindowBounds"
+_K_LAYER = "kCGWindowLayer"
+_K_IS_ONSCREEN = "kCGWindowIsOnscreen"
+_K_ALPHA = "kCGWindowAlpha"
+
+# How long a CGWindowList snapshot is reused before re-enumerating
+_WINDOW_CACHE_TTL = 0.1
+# How long a display enumeration is reused; reconfiguration invalidates it sooner
+_DISPLAY_CACHE_TTL = 0.5
+_MAX_DISPLAYS = 32
+# How long a display's refresh rate is reused before copying its mode again
+_MODE_CACHE_TTL = 2.0
+
+# Virtual key codes (US layout); shared by every backend instance and never mutated
+_KEY_CODE_MAP: dict[str, int] = {
+    "a": 0x00,
+    "b": 0x0B,
+    "c": 0x08,
+    "d": 0x02,
+    "e": 0x0E,
+    "f": 0x03,
+    "g": 0x05,
+    "h": 0x04,
+    "i": 0x22,
+    "j": 0x26,
+    "k": 0x28,
+    "l": 0x25,
+    "m": 0x2E,
+    "n": 0x2D,
+    "o": 0x1F,
+    "p": 0x23,
+    "q": 0x0C,
+    "r": 0x0F,
+    "s": 0x01,
+    "t": 0x11,
+    "u": 0x20,
+    "v": 0x09,
+    "w": 0x0D,
+    "x": 0x07,
+    "y": 0x10,
+    "z": 0x06,
+    "0": 0x1D,
+    "1": 0x12,
+    "2": 0x13,
+    "3": 0x14,
+    "4": 0x15,
+    "5": 0x17,
+    "6": 0x16,
+    "7": 0x1A,
+    "8": 0x1C,
+    "9": 0x19,
+    "enter": 0x24,
+    "return": 0x24,
+    "tab": 0x30,
+    "space": 0x31,
+    "backspace": 0x33,
+    "delete": 0x75,
+    "esc": 0x35,
+    "escape": 0x35,
+    "shift": 0x38,
+    "ctrl": 0x3B,
+    "control": 0x3B,
+    "alt": 0x3A,
+    "option": 0x3A,
+    "cmd": 0x37,
+    "command": 0x37,
+    "meta": 0x37,
+    "left": 0x7B,
+    "right": 0x7C,
+    "up": 0x7E,
+    "down": 0x7D,
+    "home": 0x73,
+    "end": 0x77,
+    "pageup": 0x74,
+    "pagedown": 0x79,
+    "f1": 0x7A,
+    "f2": 0x78,
+    "f3": 0x63,
+    "f4": 0x76,
+    "f5": 0x60,
+    "f6": 0x61,
+    "f7": 0x62,
+    "f8": 0x64,
+    "f9": 0x65,
+    "f10": 0x6D,
+    "f11": 0x67,
+    "f12": 0x6F,
+    "f13": 0x69,
+    "f14": 0x6B,
+    "f15": 0x71,
+    "capslock": 0x39,
+}
+_REVERSE_KEY_MAP = {v: k for k, v in _KEY_CODE_MAP.items()}
+# Lowercase names and Key members in one table, so lookups skip normalization
+_KEY_LOOKUP: dict[Key | str, int] = {
+    k: _KEY_CODE_MAP[k.value] for k in Key if k.value in _KEY_CODE_MAP
+}
+_KEY_LOOKUP.update(_KEY_CODE_MAP)
+
 
 class MacOSBackend(Backend):
     def __init__(self) -> None:
-        self._key_code_map = self._build_key_code_map()
-        self._reverse_key_map = {v: k for k, v in self._key_code_map.items()}
-
-    def _build_key_code_map(self) -> dict[str, int]:
-        return {
-            "a": 0x00,
-            "b": 0x0B,
-            "c": 0x08,
-            "d": 0x02,
-            "e": 0x0E,
-            "f": 0x03,
-            "g": 0x05,
-            "h": 0x04,
-            "i": 0x22,
-            "j": 0x26,
-            "k": 0x28,
-            "l": 0x25,
-            "m": 0x2E,
-            "n": 0x2D,
-            "o": 0x1F,
-            "p": 0x23,
-            "q": 0x0C,
-            "r": 0x0F,
-            "s": 0x01,
-            "t": 0x11,
-            "u": 0x20,
-            "v": 0x09,
-            "w": 0x0D,
-            "x": 0x07,
-            "y": 0x10,
-            "z": 0x06,
-            "0": 0x1D,
-            "1": 0x12,
-            "2": 0x13,
-            "3": 0x14,
-            "4": 0x15,
-            "5": 0x17,
-            "6": 0x16,
-            "7": 0x1A,
-            "8": 0x1C,
-            "9": 0x19,
-            "enter": 0x24,
-            "return": 0x24,
-            "tab": 0x30,
-            "space": 0x31,
-            "backspace": 0x33,
-            "delete": 0x75,
-            "esc": 0x35,
-            "escape": 0x35,
-            "shift": 0x38,
-            "ctrl": 0x3B,
-            "control": 0x3B,
-            "alt": 0x3A,
-            "option": 0x3A,
-            "cmd": 0x37,
-            "command": 0x37,
-            "meta": 0x37,
-            "left": 0x7B,
-            "right": 0x7C,
-            "up": 0x7E,
-            "down": 0x7D,
-            "home": 0x73,
-            "end": 0x77,
-            "pageup": 0x74,
-            "pagedown": 0x79,
-            "f1": 0x7A,
-            "f2": 0x78,
-            "f3": 0x63,
-            "f4": 0x76,
-            "f5": 0x60,
-            "f6": 0x61,
-            "f7": 0x62,
-            "f8": 0x64,
-            "f9": 0x65,
-            "f10": 0x6D,
-            "f11": 0x67,
-            "f12": 0x6F,
-            "f13": 0x69,
-            "f14": 0x6B,
-            "f15": 0x71,
-            "capslock": 0x39,
+        self._key_code_map = _KEY_CODE_MAP
+        self._reverse_key_map = _REVERSE_KEY_MAP
+        self._key_lookup = _KEY_LOOKUP
+        # One shared HID event source instead of a fresh one per synthesized event
+        self._event_source = CGEventSourceCreate(kCGEventSourceStateHIDSystemState)
+        # Button -> (down event type, up event type, CG button index)
+        self._button_events: dict[MouseButton, tuple[int, int, int]] = {
+            MouseButton.LEFT: (kCGEventLeftMouseDown, kCGEventLeftMouseUp, kCGMouseButtonLeft),
+            MouseButton.RIGHT: (kCGEventRightMouseDown, kCGEventRightMouseUp, kCGMouseButtonRight),
+            MouseButton.MIDDLE: (
+                kCGEventOtherMouseDown,
+                kCGEventOtherMouseUp,
+                kCGMouseButtonCenter,
+            ),
         }
+        # Reusable keydown/keyup events for key_type_unicode, keyed by (key code, shifted)
+        self._keydown_cache: dict[tuple[int, bool], Any] = {}
+        self._keyup_cache: dict[tuple[int, bool], Any] = {}
+        # Short-lived window list snapshots keyed by visible_only, plus the frontmost app PID
+        self._window_cache: dict[bool, tuple[float, list[WindowInfo]]] = {}
+        self._frontmost_pid_cache: tuple[float, int | None] | None = None
+        # Window handle -> owner PID for the windows in the latest enumeration
+        self._handle_to_pid: dict[Any, int] = {}
+        # Display enumeration snapshot, dropped whenever CoreGraphics reports a reconfiguration
+        self._display_cache: tuple[float, list[DisplayInfo]] | None = None
+        self._primary_display_cache: tuple[float, DisplayInfo] | None = None
+        # Display id -> (refresh rate, timestamp)
+        self._mode_cache: dict[int, tuple[float, float]] = {}
+        self._display_reconfig_callback: Any = self._on_display_reconfigured
+        Quartz.CGDisplayRegisterReconfigurationCallback(self._display_reconfig_callback, None)
+        # Last pasteboard string read, valid while the pasteboard changeCount is unchanged
+        self._pb_last_change = -1
+        self._pb_last_text: str | None = None
+        # Time and target of the last posted move, for coalescing
+        self._last_move_ts = 0.0
+        self._last_move_xy: tuple[int, int] | None = None
 
     def _get_key_code(self, key: Key | str) -> int:
-        if isinstance(key, Key):
-            key = key.value
-        key = key.lower()
-        if key in self._key_code_map:
-            return self._key_code_map[key]
-        raise ValueError(f"Unknown key: {key}")
+        try:
+            return self._key_lookup[key]
+        except KeyError:
+            pass
+        name = key.value if isinstance(key, Key) else key
+        key_code = self._key_lookup.get(name.lower())
+        if key_code is None:
+            raise ValueError(f"Unknown key: {name.lower()}")
+        return key_code
 
     def mouse_position(self) -> Point:
-        event = CGEventCreate(None)
+        event = CGEventCreate(self._event_source)
         loc = CGEventGetLocation(event)
         return Point(int(loc.x), int(loc.y))
 
     def mouse_move_to(self, x: int, y: int) -> None:
-        event = CGEventCreateMouseEvent(None, kCGEventMouseMoved, (x, y), 0)
+        # Only a repeat of the last posted target is dropped, so no move is ever lost
+        now = time.monotonic()
+        if (x, y) == self._last_move_xy and now - self._last_move_ts < self.move_coalesce_interval:
+            return
+        event = CGEventCreateMouseEvent(self._event_source, kCGEventMouseMoved, (x, y), 0)
         CGEventPost(kCGHIDEventTap, event)
+        self._last_move_ts = now
+        self._last_move_xy = (x, y)
 
     def mouse_move_rel(self, dx: int, dy: int) -> None:
         current = self.mouse_position()
         self.mouse_move_to(current.x + dx, current.y + dy)
 
     def mouse_press(self, button: MouseButton) -> None:
-        pos = self.mouse_position()
-        if button == MouseButton.LEFT:
-            event = CGEventCreateMouseEvent(
-                None, kCGEventLeftMouseDown, (pos.x, pos.y), kCGMouseButtonLeft
-            )
-        elif button == MouseButton.RIGHT:
-            event = CGEventCreateMouseEvent(
-                None, kCGEventRightMouseDown, (pos.x, pos.y), kCGMouseButtonRight
-            )
-        elif button == MouseButton.MIDDLE:
-            event = CGEventCreateMouseEvent(
-                None, kCGEventOtherMouseDown, (pos.x, pos.y), kCGMouseButtonCenter
-            )
-        else:
+        button_events = self._button_events.get(button)
+        if button_events is None:
             raise ValueError(f"Unsupported button: {button}")
+        down_type, _, cg_button = button_events
+        pos = self.mouse_position()
+        event = CGEventCreateMouseEvent(self._event_source, down_type, (pos.x, pos.y), cg_button)
         CGEventPost(kCGHIDEventTap, event)
 
     def mouse_release(self, button: MouseButton) -> None:
-        pos = self.mouse_position()
-        if button == MouseButton.LEFT:
-            event = CGEventCreateMouseEvent(
-                None, kCGEventLeftMouseUp, (pos.x, pos.y), kCGMouseButtonLeft
-            )
-        elif button == MouseButton.RIGHT:
-            event = CGEventCreateMouseEvent(
-                None, kCGEventRightMouseUp, (pos.x, pos.y), kCGMouseButtonRight
-            )
-        elif button == MouseButton.MIDDLE:
-            event = CGEventCreateMouseEvent(
-                None, kCGEventOtherMouseUp, (pos.x, pos.y), kCGMouseButtonCenter
-            )
-        else:
+        button_events = self._button_events.get(button)
+        if button_events is None:
             raise ValueError(f"Unsupported button: {button}")
+        _, up_type, cg_button = button_events
+        pos = self.mouse_position()
+        event = CGEventCreateMouseEvent(self._event_source, up_type, (pos.x, pos.y), cg_button)
         CGEventPost(kCGHIDEventTap, event)
 
     def mouse_scroll(self, dx: int, dy: int) -> None:
-        event = CGEventCreateMouseEvent(None, kCGEventScrollWheel, (0, 0), 0)
+        event = CGEventCreateMouseEvent(self._event_source, kCGEventScrollWheel, (0, 0), 0)
         Quartz.CGEventSetIntegerValueField(event, Quartz.kCGScrollWheelEventDeltaAxis1, dy)
         Quartz.CGEventSetIntegerValueField(event, Quartz.kCGScrollWheelEventDeltaAxis2, dx)
         CGEventPost(kCGHIDEventTap, event)
 
     def mouse_is_pressed(self, button: MouseButton) -> bool:
-        import Quartz
-
-        # Map MouseButton to CG button index
-        button_map = {
-            MouseButton.LEFT: kCGMouseButtonLeft,
-            MouseButton.RIGHT: kCGMouseButtonRight,
-            MouseButton.MIDDLE: kCGMouseButtonCenter,
-        }
-        cg_button = button_map.get(button)
-        if cg_button is None:
+        button_events = self._button_events.get(button)
+        if button_events is None:
             raise ValueError(f"Unsupported button: {button}")
 
-        buttons = Quartz.CGEventSourceButtonState(
-            Quartz.kCGEventSourceStateHIDSystemState, cg_button
-        )
+        buttons = CGEventSourceButtonState(kCGEventSourceStateHIDSystemState, button_events[2])
         return bool(buttons)
 
     def key_press(self, key: Key | str) -> None:
         key_code = self._get_key_code(key)
-        event = CGEventCreateKeyboardEvent(None, key_code, True)
+        event = CGEventCreateKeyboardEvent(self._event_source, key_code, True)
         CGEventPost(kCGHIDEventTap, event)
 
     def key_release(self, key: Key | str) -> None:
         key_code = self._get_key_code(key)
-        event = CGEventCreateKeyboardEvent(None, key_code, False)
+        event = CGEventCreateKeyboardEvent(self._event_source, key_code, False)
         CGEventPost(kCGHIDEventTap, event)
 
     def key_is_pressed(self, key: Key | str) -> bool:
         return False
 
-    def key_type_unicode(self, text: str) -> None:
+    def _cached_key_event(self, key_code: int, key_down: bool, shifted: bool) -> Any:
+        cache = self._keydown_cache if key_down else self._keyup_cache
+        event = cache.get((key_code, shifted))
+        if event is None:
+            event = CGEventCreateKeyboardEvent(self._event_source, key_code, key_down)
+            cache[(key_code, shifted)] = event
+        return event
+
+    def _build_type_events(self, text: str) -> list[Any]:
+        events: list[Any] = []
+        space_code = self._key_code_map["space"]
+        # Keep the modifiers the user is holding and drive only shift per character, so
+        # shifted characters need no separate shift key events. Flags are set on every
+        # call because cached events are reused across calls.
+        held = CGEventSourceFlagsState(kCGEventSourceStateHIDSystemState)
+        flags = {False: held & ~kCGEventFlagMaskShift, True: held | kCGEventFlagMaskShift}
         for char in text:
-            if char.lower() in self._key_code_map:
-                key_code = self._key_code_map[char.lower()]
-                down_event = CGEventCreateKeyboardEvent(None, key_code, True)
-                up_event = CGEventCreateKeyboardEvent(None, key_code, False)
-
-                if char.isupper():
-                    shift_code = self._key_code_map["shift"]
-                    shift_down = CGEventCreateKeyboardEvent(None, shift_code, True)
-                    CGEventPost(kCGHIDEventTap, shift_down)
-                    time.sleep(0.01)
-
-                CGEventPost(kCGHIDEventTap, down_event)
-                time.sleep(0.01)
-                CGEventPost(kCGHIDEventTap, up_event)
-
-                if char.isupper():
-                    shift_up = CGEventCreateKeyboardEvent(None, shift_code, False)
-                    CGEventPost(kCGHIDEventTap, shift_up)
-                    time.sleep(0.01)
+            key_code = self._key_code_map.get(char.lower())
+            if key_code is not None:
+                shifted = char.isupper()
+                down_event = self._cached_key_event(key_code, True, shifted)
+                up_event = self._cached_key_event(key_code, False, shifted)
+                CGEventSetFlags(down_event, flags[shifted])
+                CGEventSetFlags(up_event, flags[shifted])
             else:
-                space_code = self._key_code_map["space"]
-                down_event = CGEventCreateKeyboardEvent(None, space_code, True)
-                up_event = CGEventCreateKeyboardEvent(None, space_code, False)
-
-                from Quartz import CGEventKeyboardSetUnicodeString
-
+                down_event = CGEventCreateKeyboardEvent(self._event_source, space_code, True)
+                up_event = CGEventCreateKeyboardEvent(self._event_source, space_code, False)
                 CGEventKeyboardSetUnicodeString(down_event, len(char), char)
                 CGEventKeyboardSetUnicodeString(up_event, len(char), char)
+            events.append(down_event)
+            events.append(up_event)
+        return events
+
+    def _post_many(self, events: list[Any], interval: float = 0.0) -> None:
+        # Events come in keydown/keyup pairs; interval is the pause between pairs. Each
+        # event is stamped as it is posted, so reused events from the cache never carry
+        # their creation time.
+        for i, event in enumerate(events):
+            if interval > 0 and i and not i % 2:
+                time.sleep(interval)
+            CGEventSetTimestamp(event, time.monotonic_ns())
+            CGEventPost(kCGHIDEventTap, event)
 
-                CGEventPost(kCGHIDEventTap, down_event)
-                time.sleep(0.01)
-                CGEventPost(kCGHIDEventTap, up_event)
+    def key_type_unicode(self, text: str) -> None:
+        self._post_many(self._build_type_events(text))
+
+    def key_type_batch(self, text: str, interval: float = 0.0) -> None:
+        self._post_many(self._build_type_events(text), interval)
 
     def get_keyboard_layout(self) -> str:
         try:
@@ -281,113 +344,187 @@ class MacOSBackend(Backend):
 
         return "com.apple.keylayout.US"  # Default US layout
 
+    def close(self) -> None:
+        if self._display_reconfig_callback is not None:
+            Quartz.CGDisplayRemoveReconfigurationCallback(self._display_reconfig_callback, None)
+            self._display_reconfig_callback = None
+
+    def _on_display_reconfigured(self, display_id: int, flags: int, user_info: Any) -> None:
+        self._display_cache = None
+        self._primary_display_cache = None
+        self._mode_cache.clear()
+
     def get_displays(self) -> list[DisplayInfo]:
+        cached = self._display_cache
+        if cached is not None and time.monotonic() - cached[0] < _DISPLAY_CACHE_TTL:
+            return list(cached[1])
+
+        displays = self._enumerate_displays()
+        self._display_cache = (time.monotonic(), displays)
+        return list(displays)
+
+    def _enumerate_displays(self) -> list[DisplayInfo]:
         displays: list[DisplayInfo] = []
-        max_displays = 32
-        err, display_list, count = Quartz.CGGetActiveDisplayList(max_displays, None, None)
+        err, display_list, count = Quartz.CGGetActiveDisplayList(_MAX_DISPLAYS, None, None)
         if err or not display_list:
             return displays
 
+        # Screen origin -> backing scale, built once instead of rescanned per display
+        scale_index: dict[tuple[int, int], float] = {}
+        for screen in NSScreen.screens():
+            origin = screen.frame().origin
+            scale_index[(round(origin.x), round(origin.y))] = screen.backingScaleFactor()
+
+        main_id = CGMainDisplayID()
         for i in range(count):
             display_id = display_list[i]
             bounds = CGDisplayBounds(display_id)
+            scale = scale_index.get((round(bounds.origin.x), round(bounds.origin.y)), 1.0)
+            displays.append(self._display_info(display_id, i, bounds, scale, display_id == main_id))
 
-            scale = 1.0
-            for screen in NSScreen.screens():
-                screen_frame = screen.frame()
-                if (
-                    abs(screen_frame.origin.x - bounds.origin.x) < 1
-                    and abs(screen_frame.origin.y - bounds.origin.y) < 1
-                ):
-                    scale = screen.backingScaleFactor()
-                    break
+        return displays
 
-            is_primary = display_id == CGMainDisplayID()
+    def _refresh_rate(self, display_id: int) -> float:
+        cached = self._mode_cache.get(display_id)
+        if cached is not None and time.monotonic() - cached[1] < _MODE_CACHE_TTL:
+            return cached[0]
+
+        # PyObjC owns the copied mode and releases it with the proxy; an explicit
+        # CGDisplayModeRelease here would over-release it
+        mode = Quartz.CGDisplayCopyDisplayMode(display_id)
+        refresh_rate = Quartz.CGDisplayModeGetRefreshRate(mode) if mode is not None else 0.0
+        if refresh_rate == 0:
+            refresh_rate = 60.0
+
+        self._mode_cache[display_id] = (refresh_rate, time.monotonic())
+        return refresh_rate
+
+    def _display_info(
+        self, display_id: int, index: int, bounds: Any, scale: float, is_primary: bool
+    ) -> DisplayInfo:
+        refresh_rate = self._refresh_rate(display_id)
+        phys_width = int(bounds.size.width * scale)
+        phys_height = int(bounds.size.height * scale)
+
+        return DisplayInfo(
+            id=str(display_id),
+            name=f"Display {index + 1}",
+            bounds=Rect(
+                int(bounds.origin.x),
+                int(bounds.origin.y),
+                int(bounds.size.width),
+                int(bounds.size.height),
+            ),
+            work_area=Rect(
+                int(bounds.origin.x),
+                int(bounds.origin.y),
+                int(bounds.size.width),
+                int(bounds.size.height),
+            ),
+            scale=scale,
+            physical_size=Size(phys_width, phys_height),
+            refresh_rate=refresh_rate,
+            rotation=0,
+            is_primary=is_primary,
+        )
 
-            refresh_rate = Quartz.CGDisplayModeGetRefreshRate(
-                Quartz.CGDisplayCopyDisplayMode(display_id)
-            )
-            if refresh_rate == 0:
-                refresh_rate = 60.0
-
-            phys_width = int(bounds.size.width * scale)
-            phys_height = int(bounds.size.height * scale)
-
-            display_info = DisplayInfo(
-                id=str(display_id),
-                name=f"Display {i + 1}",
-                bounds=Rect(
-                    int(bounds.origin.x),
-                    int(bounds.origin.y),
-                    int(bounds.size.width),
-                    int(bounds.size.height),
-                ),
-                work_area=Rect(
-                    int(bounds.origin.x),
-                    int(bounds.origin.y),
-                    int(bounds.size.width),
-                    int(bounds.size.height),
-                ),
-                scale=scale,
-                physical_size=Size(phys_width, phys_height),
-                refresh_rate=refresh_rate,
-                rotation=0,
-                is_primary=is_primary,
-            )
-            displays.append(display_info)
+    def get_primary_display(self) -> DisplayInfo:
+        cached = self._primary_display_cache
+        if cached is not None and time.monotonic() - cached[0] < _DISPLAY_CACHE_TTL:
+            return cached[1]
 
-        return displays
+        display_id = CGMainDisplayID()
+        err, display_list, count = Quartz.CGGetActiveDisplayList(_MAX_DISPLAYS, None, None)
+        if err or not display_list or not count:
+            raise RuntimeError("No displays found")
+        active = [display_list[i] for i in range(count)]
+        index = active.index(display_id) if display_id in active else 0
 
-    def get_primary_display(self) -> DisplayInfo:
-        displays = self.get_displays()
-        for display in displays:
-            if display.is_primary:
-                return display
-        if displays:
-            return displays[0]
-        raise RuntimeError("No displays found")
+        # screens()[0] is the menu bar screen, i.e. the main display; mainScreen() follows focus
+        screens = NSScreen.screens()
+        scale = screens[0].backingScaleFactor() if screens else 1.0
+
+        primary = self._display_info(display_id, index, CGDisplayBounds(display_id), scale, True)
+        self._primary_display_cache = (time.monotonic(), primary)
+        return primary
 
     def get_virtual_screen_rect(self) -> Rect:
         displays = self.get_displays()
         if not displays:
             return Rect(0, 0, 0, 0)
 
-        min_x = min(d.bounds.x for d in displays)
-        min_y = min(d.bounds.y for d in displays)
-        max_x = max(d.bounds.x + d.bounds.width for d in displays)
-        max_y = max(d.bounds.y + d.bounds.height for d in displays)
+        first = displays[0].bounds
+        min_x, min_y = first.x, first.y
+        max_x, max_y = first.x + first.width, first.y + first.height
+        for d in displays[1:]:
+            b = d.bounds
+            min_x = min(min_x, b.x)
+            min_y = min(min_y, b.y)
+            max_x = max(max_x, b.x + b.width)
+            max_y = max(max_y, b.y + b.height)
 
         return Rect(min_x, min_y, max_x - min_x, max_y - min_y)
 
-    def list_windows(self, visible_only: bool = True) -> list[WindowInfo]:
+    def invalidate_window_cache(self) -> None:
+        self._window_cache.clear()
+        self._frontmost_pid_cache = None
+
+    def list_windows(self, visible_only: bool = True, pid: int | None = None) -> list[WindowInfo]:
+        cached = self._window_cache.get(visible_only)
+        if cached is not None and time.monotonic() - cached[0] < _WINDOW_CACHE_TTL:
+            if pid is None:
+                return list(cached[1])
+            return [w for w in cached[1] if w.pid == pid]
+
+        if pid is not None:
+            # Filtered enumerations are partial, so they are not cached
+            return self._enumerate_windows(visible_only, pid)
+
+        windows = self._enumerate_windows(visible_only)
+        self._window_cache[visible_only] = (time.monotonic(), windows)
+        return list(windows)
+
+    def _enumerate_windows(self, visible_only: bool, pid: int | None = None) -> list[WindowInfo]:
         options = kCGWindowListOptionOnScreenOnly if visible_only else 0
         options |= kCGWindowListExcludeDesktopElements
 
         window_list = CGWindowListCopyWindowInfo(options, kCGNullWindowID)
         windows: list[WindowInfo] = []
+        handle_to_pid: dict[Any, int] = {}
+        # Rebuilt from every listing, so closed windows drop out; focus_window enumerates
+        # everything again for a handle this listing did not cover
+        self._handle_to_pid = handle_to_pid
 
         if not window_list:
             return windows
 
         for window in window_list:
-            window_dict = dict(window)
-
-            owner_name = window_dict.get("kCGWindowOwnerName", "")
-            window_name = window_dict.get("kCGWindowName", "")
-            window_number = window_dict.get("kCGWindowNumber", 0)
-            owner_pid = window_dict.get("kCGWindowOwnerPID", 0)
-
-            bounds_dict = window_dict.get("kCGWindowBounds", {})
-            x = int(bounds_dict.get("X", 0))
-            y = int(bounds_dict.get("Y", 0))
-            width = int(bounds_dict.get("Width", 0))
-            height = int(bounds_dict.get("Height", 0))
+            layer = window.objectForKey_(_K_LAYER) or 0
+            # Visible listings only report normal-level windows (drops Dock, menu bar, overlays)
+            if visible_only and layer != 0:
+                continue
 
-            layer = window_dict.get("kCGWindowLayer", 0)
-            is_on_screen = window_dict.get("kCGWindowIsOnscreen", False)
+            owner_pid = window.objectForKey_(_K_OWNER_PID) or 0
+            if pid is not None and owner_pid != pid:
+                continue
 
+            # Only bridge the fields we use; dict(window) would copy every key
+            bounds = window.objectForKey_(_K_BOUNDS)
+            if bounds is None:
+                continue
+            width = int(bounds.objectForKey_("Width") or 0)
+            height = int(bounds.objectForKey_("Height") or 0)
             if width == 0 or height == 0:
                 continue
+            x = int(bounds.objectForKey_("X") or 0)
+            y = int(bounds.objectForKey_("Y") or 0)
+
+            owner_name = window.objectForKey_(_K_OWNER_NAME) or ""
+            window_name = window.objectForKey_(_K_NAME) or ""
+            window_number = window.objectForKey_(_K_NUMBER) or 0
+
+            is_on_screen = bool(window.objectForKey_(_K_IS_ONSCREEN))
+            alpha = window.objectForKey_(_K_ALPHA)
 
             window_info = WindowInfo(
                 handle=window_number,
@@ -401,58 +538,58 @@ class MacOSBackend(Backend):
                 is_visible=is_on_screen and visible_only,
                 is_active=False,
                 is_always_on_top=layer > 0,
-                opacity=window_dict.get("kCGWindowAlpha", 1.0),
+                opacity=1.0 if alpha is None else alpha,
             )
             windows.append(window_info)
+            handle_to_pid[window_number] = owner_pid
 
         return windows
 
-    def get_active_window(self) -> WindowInfo | None:
-        workspace = NSWorkspace.sharedWorkspace()
-        active_app = workspace.frontmostApplication()
+    def _frontmost_pid(self) -> int | None:
+        cached = self._frontmost_pid_cache
+        if cached is not None and time.monotonic() - cached[0] < _WINDOW_CACHE_TTL:
+            return cached[1]
 
-        if not active_app:
-            return None
-
-        pid = active_app.processIdentifier()
-        windows = self.list_windows(visible_only=True)
+        active_app = NSWorkspace.sharedWorkspace().frontmostApplication()
+        pid = active_app.processIdentifier() if active_app else None
+        self._frontmost_pid_cache = (time.monotonic(), pid)
+        return pid
 
-        for window in windows:
-            if window.pid == pid:
-                window.is_active = True
-                return window
+    def get_active_window(self) -> WindowInfo | None:
+        pid = self._frontmost_pid()
+        if pid is None:
+            return None
 
-        return None
+        windows = self.list_windows(visible_only=True, pid=pid)
+        if not windows:
+            return None
+        # Copy so the cached snapshot is not mutated
+        return replace(windows[0], is_active=True)
 
     def get_window_at(self, x: int, y: int) -> WindowInfo | None:
-        windows = self.list_windows(visible_only=True)
-        point = Point(x, y)
-
-        for window in windows:
-            if window.rect.contains(point):
+        # CGWindowList is front-to-back, so the first hit is the topmost window
+        for window in self.list_windows(visible_only=True):
+            r = window.rect
+            if r.x <= x <= r.x + r.width and r.y <= y <= r.y + r.height:
                 return window
 
         return None
 
     def focus_window(self, handle: Any) -> None:
-        windows = self.list_windows(visible_only=False)
-        target_window = None
+        pid = self._handle_to_pid.get(handle)
+        if pid is None:
+            # Unknown handle: enumerate once, which refreshes the handle index
+            self.list_windows(visible_only=False)
+            pid = self._handle_to_pid.get(handle)
+            if pid is None:
+                return
 
-        for window in windows:
-            if window.handle == handle:
-                target_window = window
-                break
+        app = NSRunningApplication.runningApplicationWithProcessIdentifier_(pid)
+        if app is not None:
+            app.activateWithOptions_(NSApplicationActivateIgnoringOtherApps)
 
-        if not target_window:
-            return
-
-        workspace = NSWorkspace.sharedWorkspace()
-        running_apps = workspace.runningApplications()
-
-        for app in running_apps:
-            if app.processIdentifier() == target_window.pid:
-                app.activateWithOptions_(NSApplicationActivationPolicyRegular)
-                break
+        # Focus changes z-order and the frontmost app
+        self.invalidate_window_cache()
 
     def move_window(self, handle: Any, x: int, y: int) -> None:
         raise BackendCapabilityError("move_window", "macOS")
@@ -475,15 +612,22 @@ class MacOSBackend(Backend):
     def set_window_always_on_top(self, handle: Any, enabled: bool) -> None:
         raise BackendCapabilityError("set_window_always_on_top", "macOS")
 
-    def clipboard_get_text(self) -> str:
+    def _pasteboard_text(self) -> str | None:
         pasteboard = NSPasteboard.generalPasteboard()
-        text = pasteboard.stringForType_(NSStringPboardType)
+        change_count = pasteboard.changeCount()
+        if change_count != self._pb_last_change:
+            self._pb_last_text = pasteboard.stringForType_(NSPasteboardTypeString)
+            self._pb_last_change = change_count
+        return self._pb_last_text
+
+    def clipboard_get_text(self) -> str:
+        text = self._pasteboard_text()
         return text if text else ""
 
     def clipboard_set_text(self, text: str) -> None:
         pasteboard = NSPasteboard.generalPasteboard()
         pasteboard.clearContents()
-        pasteboard.setString_forType_(text, NSStringPboardType)
+        pasteboard.setString_forType_(text, NSPasteboardTypeString)
 
     def clipboard_clear(self) -> None:
         pasteboard = NSPasteboard.generalPasteboard()
@@ -491,8 +635,11 @@ class MacOSBackend(Backend):
 
     def clipboard_has_text(self) -> bool:
         pasteboard = NSPasteboard.generalPasteboard()
-        text = pasteboard.stringForType_(NSStringPboardType)
-        return text is not None and len(text) > 0
+        if pasteboard.changeCount() != self._pb_last_change:
+            # No string type at all needs no copy; an empty string still has to be read
+            if pasteboard.availableTypeFromArray_([NSPasteboardTypeString]) is None:
+                return False
+        return bool(self._pasteboard_text())
 
     def check_permissions(self) -> dict[str, bool]:
         perms = {
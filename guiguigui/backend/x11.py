@@ -2,105 +2,224 @@
 
 from __future__ import annotations
 
+import os
+import selectors
+import threading
 import time
+from collections import OrderedDict, deque
+from collections.abc import Iterator, Sequence
 from typing import Any
 
 from ..core.types import DisplayInfo, Key, MouseButton, Point, Rect, Size, WindowInfo, WindowState
 from .base import Backend
 
 try:
-    from Xlib import XK, X, display
+    from Xlib import XK, X, display, error
     from Xlib.ext import randr
     from Xlib.ext.xtest import fake_input
-    from Xlib.protocol import event
+    from Xlib.protocol import event, request
 except ImportError as e:
     raise ImportError(
         "python-xlib is required for X11 backend. Install with: pip install python-xlib"
     ) from e
 
+# Core protocol button numbers used by XTest
+_BUTTON_DETAIL = {
+    MouseButton.LEFT: 1,
+    MouseButton.MIDDLE: 2,
+    MouseButton.RIGHT: 3,
+    MouseButton.X1: 8,
+    MouseButton.X2: 9,
+}
+
+# Pointer state masks reported by query_pointer
+_BUTTON_MASK = {
+    MouseButton.LEFT: X.Button1Mask,
+    MouseButton.MIDDLE: X.Button2Mask,
+    MouseButton.RIGHT: X.Button3Mask,
+    MouseButton.X1: X.Button4Mask,
+    MouseButton.X2: X.Button5Mask,
+}
+
+# Key names -> X keysym names for non-alphanumeric keys
+_SPECIAL_KEYSYMS = {
+    "enter": "Return",
+    "return": "Return",
+    "tab": "Tab",
+    "space": "space",
+    "backspace": "BackSpace",
+    "delete": "Delete",
+    "esc": "Escape",
+    "escape": "Escape",
+    "shift": "Shift_L",
+    "ctrl": "Control_L",
+    "control": "Control_L",
+    "alt": "Alt_L",
+    "cmd": "Super_L",
+    "command": "Super_L",
+    "super": "Super_L",
+    "caps_lock": "Caps_Lock",
+    "left": "Left",
+    "right": "Right",
+    "up": "Up",
+    "down": "Down",
+    "home": "Home",
+    "end": "End",
+    "page_up": "Page_Up",
+    "page_down": "Page_Down",
+}
+
+# How long a window tree snapshot is reused before walking the tree again
+_WINDOW_CACHE_TTL = 0.05
+# Interpolated pointer motion round-trips to the server once per this many steps
+_MOTION_SYNC_EVERY = 8
+# How long displays are reused when RandR change notifications are unavailable
+_DISPLAY_CACHE_TTL = 2.0
+# Windows whose decoded title, class and PID are kept between list_windows calls
+_PROP_CACHE_SIZE = 512
+
 
 class X11Backend(Backend):
     """X11 backend implementation using python-xlib."""
 
+    # Atoms used by the EWMH/ICCCM and clipboard code, interned once per connection
+    _ATOM_NAMES = (
+        "_NET_WM_NAME",
+        "_NET_WM_PID",
+        "_NET_ACTIVE_WINDOW",
+        "_NET_WM_STATE",
+        "_NET_WM_STATE_MAXIMIZED_VERT",
+        "_NET_WM_STATE_MAXIMIZED_HORZ",
+        "WM_PROTOCOLS",
+        "WM_STATE",
+        "WM_DELETE_WINDOW",
+        "_NET_WM_WINDOW_OPACITY",
+        "CARDINAL",
+        "_NET_WM_STATE_ABOVE",
+        "CLIPBOARD",
+        "UTF8_STRING",
+        "STRING",
+        "XSEL_DATA",
+        "TARGETS",
+    )
+
     def __init__(self) -> None:
         self._display = display.Display()
         self._root = self._display.screen().root
+        self._atoms: dict[str, int] = {
+            name: self._display.intern_atom(name) for name in self._ATOM_NAMES
+        }
+        self._load_keymap()
+        # Display list and when it was queried, kept until RandR reports a screen change
+        # (or for _DISPLAY_CACHE_TTL without RandR notifications)
+        self._displays_cache: list[DisplayInfo] | None = None
+        self._displays_cache_ts = 0.0
+        self._randr_screen_change = self._select_randr_notify()
+        # Short-lived window list snapshots keyed by (visible_only, deep)
+        self._window_cache: dict[tuple[bool, bool], tuple[float, list[WindowInfo]]] = {}
+        # Properties read per window as (atom, expected type, length in 32-bit units):
+        # 512 bytes of title, 256 of class, one CARDINAL of PID. Type mismatches and
+        # longer values fall back to a full read.
+        self._prop_specs = (
+            (self._atoms["_NET_WM_NAME"], self._atoms["UTF8_STRING"], 128),
+            (X.XA_WM_NAME, X.AnyPropertyType, 128),
+            (X.XA_WM_CLASS, X.XA_STRING, 64),
+            (self._atoms["_NET_WM_PID"], X.XA_CARDINAL, 1),
+        )
+        self._prop_atoms = frozenset(atom for atom, _, _ in self._prop_specs)
+        # Decoded (title, class_name, pid) per window id, least recently used first;
+        # entries are dropped when PropertyNotify reports one of their properties changed
+        self._prop_cache: OrderedDict[int, tuple[str, str, int]] = OrderedDict()
+        # Event mask this connection has selected per client window; change_attributes
+        # replaces a window's whole mask, so new bits are ORed into this one
+        self._event_masks: dict[int, int] = {}
+        # check_permissions() result for this connection
+        self._permissions: dict[str, bool] | None = None
+        # Guards _clipboard_text, which the clipboard owner thread serves from
+        self._clipboard_lock = threading.Lock()
+
+    def _load_keymap(self) -> None:
+        """Build the key lookup tables from the server's current keyboard mapping."""
+        self._keysym_to_keycode = self._build_keysym_index()
         self._key_code_map = self._build_key_code_map()
+        # Lowercase names and Key members in one table, so lookups skip normalization;
+        # other spellings are added as they are resolved, until the next reload
+        self._key_lookup: dict[Key | str, int] = {
+            k: self._key_code_map[k.value.lower()]
+            for k in Key
+            if k.value.lower() in self._key_code_map
+        }
+        self._key_lookup.update(self._key_code_map)
+
+    def _build_keysym_index(self) -> dict[int, int]:
+        """Build a keysym to keycode index from a single GetKeyboardMapping request."""
+        info = self._display.display.info
+        first = info.min_keycode
+        rows = self._display.get_keyboard_mapping(first, info.max_keycode - first + 1)
+
+        # Same preference as keysym_to_keycode: lowest column index, then lowest keycode
+        best: dict[int, tuple[int, int]] = {}
+        for keycode, syms in enumerate(rows, start=first):
+            for index, sym in enumerate(syms):
+                if sym != X.NoSymbol and (sym not in best or (index, keycode) < best[sym]):
+                    best[sym] = (index, keycode)
+        return {sym: keycode for sym, (_, keycode) in best.items()}
 
     def _build_key_code_map(self) -> dict[str, int]:
-        """Build key name to keycode mapping using XKeysymToKeycode."""
+        """Build key name to keycode mapping from the keysym index."""
         key_map = {}
 
         # Letters
         for c in "abcdefghijklmnopqrstuvwxyz":
             keysym = XK.string_to_keysym(c)
-            keycode = self._display.keysym_to_keycode(keysym)
+            keycode = self._keysym_to_keycode.get(keysym)
             if keycode:
                 key_map[c] = keycode
 
         # Numbers
         for i in range(10):
             keysym = XK.string_to_keysym(str(i))
-            keycode = self._display.keysym_to_keycode(keysym)
+            keycode = self._keysym_to_keycode.get(keysym)
             if keycode:
                 key_map[str(i)] = keycode
 
-        # Special keys mapping
-        special_keys = {
-            "enter": "Return",
-            "return": "Return",
-            "tab": "Tab",
-            "space": "space",
-            "backspace": "BackSpace",
-            "delete": "Delete",
-            "esc": "Escape",
-            "escape": "Escape",
-            "shift": "Shift_L",
-            "ctrl": "Control_L",
-            "control": "Control_L",
-            "alt": "Alt_L",
-            "cmd": "Super_L",
-            "command": "Super_L",
-            "super": "Super_L",
-            "caps_lock": "Caps_Lock",
-            "left": "Left",
-            "right": "Right",
-            "up": "Up",
-            "down": "Down",
-            "home": "Home",
-            "end": "End",
-            "page_up": "Page_Up",
-            "page_down": "Page_Down",
-        }
-
-        for key_name, x_key_name in special_keys.items():
+        # Special keys
+        for key_name, x_key_name in _SPECIAL_KEYSYMS.items():
             keysym = XK.string_to_keysym(x_key_name)
-            keycode = self._display.keysym_to_keycode(keysym)
+            keycode = self._keysym_to_keycode.get(keysym)
             if keycode:
                 key_map[key_name] = keycode
 
         # Function keys
         for i in range(1, 13):
             keysym = XK.string_to_keysym(f"F{i}")
-            keycode = self._display.keysym_to_keycode(keysym)
+            keycode = self._keysym_to_keycode.get(keysym)
             if keycode:
                 key_map[f"f{i}"] = keycode
 
         return key_map
 
-    def _get_key_code(self, key: Key | str) -> int:
+    def _key_code(self, key: Key | str) -> int:
+        """Get keycode with one dict lookup, remembering spellings resolved the slow way."""
+        keycode = self._key_lookup.get(key)
+        if keycode is None:
+            keycode = self._resolve_key_code(key)
+            self._key_lookup[key] = keycode
+        return keycode
+
+    def _resolve_key_code(self, key: Key | str) -> int:
         """Convert Key enum or string to X11 keycode."""
         if isinstance(key, Key):
             key_str = key.value.lower()
         else:
-            key_str = str(key).lower()
+            key_str = key.lower()
 
         keycode = self._key_code_map.get(key_str)
         if keycode is None:
             # Try as single character
             if len(key_str) == 1:
                 keysym = XK.string_to_keysym(key_str)
-                keycode = self._display.keysym_to_keycode(keysym)
+                keycode = self._keysym_to_keycode.get(keysym)
 
         if keycode is None:
             raise ValueError(f"Unknown key: {key}")
@@ -141,6 +260,17 @@ class X11Backend(Backend):
             # Ignore AttributeError from malformed error objects (e.g., BadRRModeError)
             pass
 
+    def _sync_or_flush(self, sync: bool) -> None:
+        """Round-trip when the caller needs the server to have processed the request.
+
+        A flush is enough for later queries on this connection (such as
+        mouse_is_pressed), since the server handles its requests in order.
+        """
+        if sync:
+            self._safe_sync()
+        else:
+            self._safe_flush()
+
     # Mouse methods
     def mouse_position(self) -> Point:
         """Get current mouse position."""
@@ -152,53 +282,53 @@ class X11Backend(Backend):
         if duration > 0:
             start = self.mouse_position()
             steps = max(10, int(duration * 60))  # 60 FPS
+            last: tuple[int, int] | None = None
             for i in range(1, steps + 1):
                 t = i / steps
                 cur_x = int(start.x + (x - start.x) * t)
                 cur_y = int(start.y + (y - start.y) * t)
-                fake_input(self._display, X.MotionNotify, x=cur_x, y=cur_y)
-                self._safe_sync()
+                # Push motion without waiting on the server; sync periodically to bound lag
+                if (cur_x, cur_y) != last:
+                    fake_input(self._display, X.MotionNotify, x=cur_x, y=cur_y)
+                    last = (cur_x, cur_y)
+                if i % _MOTION_SYNC_EVERY == 0 or i == steps:
+                    self._safe_sync()
+                else:
+                    self._safe_flush()
                 time.sleep(duration / steps)
         else:
             fake_input(self._display, X.MotionNotify, x=x, y=y)
             self._safe_sync()
 
+    def mouse_move_and_position(self, x: int, y: int) -> Point:
+        """Move mouse and read the pointer back in the same round-trip."""
+        fake_input(self._display, X.MotionNotify, x=x, y=y)
+        # QueryPointer is answered after the motion is processed, so no separate sync
+        pointer = self._root.query_pointer()
+        return Point(pointer.root_x, pointer.root_y)
+
     def mouse_move_rel(self, dx: int, dy: int, duration: float = 0.0) -> None:
         """Move mouse relative to current position."""
         pos = self.mouse_position()
         self.mouse_move_to(pos.x + dx, pos.y + dy, duration)
 
-    def mouse_press(self, button: MouseButton) -> None:
-        """Press mouse button."""
-        button_map = {
-            MouseButton.LEFT: 1,
-            MouseButton.MIDDLE: 2,
-            MouseButton.RIGHT: 3,
-            MouseButton.X1: 8,
-            MouseButton.X2: 9,
-        }
-        x_button = button_map.get(button)
+    def mouse_press(self, button: MouseButton, sync: bool = False) -> None:
+        """Press mouse button; flushed only, unless sync waits for the server."""
+        x_button = _BUTTON_DETAIL.get(button)
         if x_button is None:
             raise ValueError(f"Unsupported button: {button}")
 
         fake_input(self._display, X.ButtonPress, detail=x_button)
-        self._safe_sync()
+        self._sync_or_flush(sync)
 
-    def mouse_release(self, button: MouseButton) -> None:
-        """Release mouse button."""
-        button_map = {
-            MouseButton.LEFT: 1,
-            MouseButton.MIDDLE: 2,
-            MouseButton.RIGHT: 3,
-            MouseButton.X1: 8,
-            MouseButton.X2: 9,
-        }
-        x_button = button_map.get(button)
+    def mouse_release(self, button: MouseButton, sync: bool = False) -> None:
+        """Release mouse button; flushed only, unless sync waits for the server."""
+        x_button = _BUTTON_DETAIL.get(button)
         if x_button is None:
             raise ValueError(f"Unsupported button: {button}")
 
         fake_input(self._display, X.ButtonRelease, detail=x_button)
-        self._safe_sync()
+        self._sync_or_flush(sync)
 
     def mouse_scroll(self, dx: int, dy: int) -> None:
         """Scroll mouse wheel."""
@@ -226,14 +356,7 @@ class X11Backend(Backend):
     def mouse_is_pressed(self, button: MouseButton) -> bool:
         """Check if mouse button is pressed."""
         pointer = self._root.query_pointer()
-        button_map = {
-            MouseButton.LEFT: X.Button1Mask,
-            MouseButton.MIDDLE: X.Button2Mask,
-            MouseButton.RIGHT: X.Button3Mask,
-            MouseButton.X1: X.Button4Mask,
-            MouseButton.X2: X.Button5Mask,
-        }
-        mask = button_map.get(button)
+        mask = _BUTTON_MASK.get(button)
         if mask is None:
             return False
         return bool(pointer.mask & mask)
@@ -241,43 +364,80 @@ class X11Backend(Backend):
     # Keyboard methods
     def key_press(self, key: Key | str) -> None:
         """Press key."""
-        keycode = self._get_key_code(key)
+        self._drain_events(read_socket=False)
+        keycode = self._key_code(key)
         fake_input(self._display, X.KeyPress, detail=keycode)
         self._safe_flush()
 
     def key_release(self, key: Key | str) -> None:
         """Release key."""
-        keycode = self._get_key_code(key)
+        keycode = self._key_code(key)
         fake_input(self._display, X.KeyRelease, detail=keycode)
         self._safe_flush()
 
+    def key_press_batch(self, keys: Sequence[Key | str]) -> None:
+        """Press keys in order as one burst with a single flush."""
+        self._drain_events(read_socket=False)
+        # Resolve everything first so an unknown key cannot leave earlier ones held
+        keycodes = [self._key_code(key) for key in keys]
+        for keycode in keycodes:
+            fake_input(self._display, X.KeyPress, detail=keycode)
+        self._safe_flush()
+
+    def key_release_batch(self, keys: Sequence[Key | str]) -> None:
+        """Release keys in order as one burst with a single flush."""
+        keycodes = [self._key_code(key) for key in keys]
+        for keycode in keycodes:
+            fake_input(self._display, X.KeyRelease, detail=keycode)
+        self._safe_flush()
+
+    def key_tap_sequence(self, keys: Sequence[Key | str]) -> None:
+        """Tap keys in order as one burst, synced once at the end."""
+        self._drain_events(read_socket=False)
+        keycodes = [self._key_code(key) for key in keys]
+        for keycode in keycodes:
+            fake_input(self._display, X.KeyPress, detail=keycode)
+            fake_input(self._display, X.KeyRelease, detail=keycode)
+        self._safe_sync()
+
     def key_is_pressed(self, key: Key | str) -> bool:
         """Check if key is pressed."""
-        keycode = self._get_key_code(key)
+        return self.key_states([key])[0]
+
+    def key_states(self, keys: Sequence[Key | str]) -> list[bool]:
+        """Check several keys against a single QueryKeymap snapshot."""
+        keycodes = [self._key_code(key) for key in keys]
         keyboard = self._display.query_keymap()
-        # keyboard is a list of 32 bytes
-        byte_index = keycode // 8
-        bit_index = keycode % 8
-        if byte_index < len(keyboard):
-            return bool(keyboard[byte_index] & (1 << bit_index))
-        return False
-
-    def key_type_unicode(self, char: str) -> None:
-        """Type Unicode text (character or string)."""
-        # For ASCII strings, type each character
-        if all(ord(c) < 128 for c in char):
-            for c in char:
-                try:
-                    self.key_press(c)
-                    time.sleep(0.01)
-                    self.key_release(c)
-                except ValueError:
-                    # If key not found, skip it
-                    pass
-            return
+        # keyboard is a list of 32 bytes, one bit per keycode
+        return [
+            keycode // 8 < len(keyboard) and bool(keyboard[keycode // 8] & (1 << keycode % 8))
+            for keycode in keycodes
+        ]
 
+    def key_type_unicode(self, char: str, interval: float = 0.0) -> None:
+        """Type Unicode text (character or string)."""
         # For Unicode, we need to use XIM or similar
-        raise NotImplementedError("Unicode typing not yet implemented for X11")
+        if not all(ord(c) < 128 for c in char):
+            raise NotImplementedError("Unicode typing not yet implemented for X11")
+
+        self._drain_events(read_socket=False)
+        # Queue every press/release back-to-back and sync once, unless pacing is requested
+        for c in char:
+            try:
+                keycode = self._key_code(c)
+            except ValueError:
+                # If key not found, skip it
+                continue
+            fake_input(self._display, X.KeyPress, detail=keycode)
+            fake_input(self._display, X.KeyRelease, detail=keycode)
+            if interval > 0:
+                self._safe_flush()
+                time.sleep(interval)
+        self._safe_sync()
+
+    def key_type_batch(self, text: str, interval: float = 0.0) -> None:
+        """Type ASCII text as one batched submission."""
+        self.key_type_unicode(text, interval)
 
     def get_keyboard_layout(self) -> str:
         """Get current keyboard layout."""
@@ -286,15 +446,79 @@ class X11Backend(Backend):
         return "x11-default"
 
     # Display methods
+    def _select_randr_notify(self) -> int | None:
+        """Subscribe to RandR screen changes and return their event code, if supported."""
+        try:
+            ext = self._display.query_extension("RANDR")
+            if not ext or not ext.present:
+                return None
+            self._root.xrandr_select_input(randr.RRScreenChangeNotifyMask)
+            self._safe_flush()
+            return int(ext.first_event) + randr.RRScreenChangeNotify
+        except Exception:
+            return None
+
+    def _dispatch_event(self, event_obj: Any) -> None:
+        """Handle an event read while waiting for something else."""
+        if event_obj.type == self._randr_screen_change:
+            self._displays_cache = None
+        elif event_obj.type == X.PropertyNotify and event_obj.atom in self._prop_atoms:
+            self._prop_cache.pop(event_obj.window.id, None)
+        elif event_obj.type == X.DestroyNotify:
+            self._forget_window(event_obj.window.id)
+        elif event_obj.type == X.MappingNotify and event_obj.request == X.MappingKeyboard:
+            # Sent to every client without selecting for it
+            self._load_keymap()
+
+    def _queued_events(self) -> int:
+        """Count events already read off the socket, without any I/O (like XQLength)."""
+        return len(self._display.display.event_queue)
+
+    def _drain_events(self, read_socket: bool = True) -> None:
+        """Drain queued events so pending RandR, property and keymap changes drop stale caches.
+
+        pending_events() costs a send/recv pass, so it runs once up front, and only
+        when read_socket is set; otherwise just the events earlier replies already
+        buffered are handled. next_event() does no I/O while the queue is non-empty.
+        The queue is always emptied: an event left behind could be the one that
+        invalidates a cache the caller is about to read.
+        """
+        if read_socket:
+            self._display.pending_events()
+        while self._queued_events():
+            self._dispatch_event(self._display.next_event())
+
     def get_displays(self) -> list[DisplayInfo]:
         """Get all displays."""
+        if self._randr_screen_change is None:
+            # No change notifications to invalidate the cache with, so let it expire
+            if time.monotonic() - self._displays_cache_ts >= _DISPLAY_CACHE_TTL:
+                self._displays_cache = None
+        else:
+            self._drain_events()
+
+        if self._displays_cache is None:
+            self._displays_cache = self._query_displays()
+            self._displays_cache_ts = time.monotonic()
+        return list(self._displays_cache)
+
+    def _screen_resources(self, window: Any) -> Any:
+        """Get screen resources without making the server re-probe outputs."""
+        try:
+            # RandR 1.3+: the server's current configuration, no EDID/DDC polling
+            return randr.get_screen_resources_current(window)
+        except error.XError:
+            return randr.get_screen_resources(window)
+
+    def _query_displays(self) -> list[DisplayInfo]:
+        """Query displays from RandR, falling back to the core screen size."""
         displays = []
 
         # Get RandR screen resources
         try:
             screen = self._display.screen()
             window = screen.root
-            resources = randr.get_screen_resources(window)
+            resources = self._screen_resources(window)
 
             for i, output in enumerate(resources.outputs):
                 output_info = randr.get_output_info(window, output, resources.config_timestamp)
@@ -359,119 +583,278 @@ class X11Backend(Backend):
         if not displays:
             return Rect(0, 0, 1920, 1080)
 
-        min_x = min(d.bounds.x for d in displays)
-        min_y = min(d.bounds.y for d in displays)
-        max_x = max(d.bounds.x + d.bounds.width for d in displays)
-        max_y = max(d.bounds.y + d.bounds.height for d in displays)
+        # Single pass over the displays, seeded from the first so the extremes stay ints
+        first = displays[0].bounds
+        min_x, min_y = first.x, first.y
+        max_x, max_y = first.x + first.width, first.y + first.height
+        for d in displays[1:]:
+            b = d.bounds
+            if b.x < min_x:
+                min_x = b.x
+            if b.y < min_y:
+                min_y = b.y
+            if b.x + b.width > max_x:
+                max_x = b.x + b.width
+            if b.y + b.height > max_y:
+                max_y = b.y + b.height
 
         return Rect(min_x, min_y, max_x - min_x, max_y - min_y)
 
     # Window methods
-    def list_windows(self, visible_only: bool = True) -> list[WindowInfo]:
-        """List all windows."""
-        windows = []
-
-        def get_window_info(win: Any) -> WindowInfo | None:
+    def invalidate_window_cache(self) -> None:
+        """Drop cached window lists so the next query walks the tree again."""
+        self._window_cache.clear()
+
+    def list_windows(self, visible_only: bool = True, deep: bool = False) -> list[WindowInfo]:
+        """List top-level windows, or every window in the tree when deep is set."""
+        cached = self._window_cache.get((visible_only, deep))
+        if cached is not None and time.monotonic() - cached[0] < _WINDOW_CACHE_TTL:
+            return list(cached[1])
+
+        self._drain_events()
+        windows = list(self._iter_windows(visible_only, deep))
+        self._window_cache[(visible_only, deep)] = (time.monotonic(), windows)
+        return list(windows)
+
+    def _iter_windows(self, visible_only: bool, deep: bool) -> Iterator[WindowInfo]:
+        """Lazily yield WindowInfo so callers that stop early skip the remaining queries."""
+        if not deep:
+            # Top-level windows only; decorations, tooltips and widget children are skipped
             try:
-                # Get window attributes
-                attrs = win.get_attributes()
-                if visible_only and attrs.map_state != X.IsViewable:
-                    return None
-
-                # Get geometry
-                geom = win.get_geometry()
-
-                # Get window title
-                try:
-                    title_prop = win.get_full_property(self._display.intern_atom("_NET_WM_NAME"), 0)
-                    if title_prop:
-                        title = title_prop.value.decode("utf-8", errors="ignore")
-                    else:
-                        title_prop = win.get_full_property(X.XA_WM_NAME, 0)
-                        title = (
-                            title_prop.value.decode("latin1", errors="ignore") if title_prop else ""
-                        )
-                except Exception:
-                    title = ""
-
-                # Get window class
-                try:
-                    class_prop = win.get_full_property(X.XA_WM_CLASS, 0)
-                    class_name = (
-                        class_prop.value.decode("latin1", errors="ignore").split("\x00")[1]
-                        if class_prop
-                        else ""
-                    )
-                except Exception:
-                    class_name = ""
-
-                # Get PID
-                try:
-                    pid_prop = win.get_full_property(self._display.intern_atom("_NET_WM_PID"), 0)
-                    pid = pid_prop.value[0] if pid_prop else 0
-                except Exception:
-                    pid = 0
-
-                rect = Rect(geom.x, geom.y, geom.width, geom.height)
-                return WindowInfo(
-                    handle=win.id,
-                    title=title,
-                    class_name=class_name,
-                    pid=pid,
-                    process_name="",  # Not easily available
-                    rect=rect,
-                    client_rect=rect,  # Use same rect for simplicity
-                    state=WindowState.NORMAL,  # TODO: detect state properly
-                    is_visible=attrs.map_state == X.IsViewable,
-                    is_active=False,  # Will be determined by caller
-                    is_always_on_top=False,  # Not easily detectable
-                    opacity=1.0,  # Default opacity
-                    display=None,
-                )
+                children = self._root.query_tree().children
             except Exception:
-                return None
+                return
+            for win in children:
+                info = self._make_window_info(win, visible_only)
+                if info:
+                    yield info
+            return
 
-        # Iterate through all windows
-        def traverse(win: Any) -> None:
-            info = get_window_info(win)
+        # Iterative pre-order walk; children are pushed reversed to keep the recursive order
+        stack: deque[Any] = deque([self._root])
+        while stack:
+            win = stack.pop()
+            info = self._make_window_info(win, visible_only)
             if info:
-                windows.append(info)
+                yield info
             try:
-                children = win.query_tree().children
-                for child in children:
-                    traverse(child)
+                stack.extend(reversed(win.query_tree().children))
             except Exception:
                 pass
 
-        traverse(self._root)
-        return windows
+    def _select_events(self, win: Any, mask: int) -> None:
+        """Add mask to the events selected on a client window, leaving the root's mask alone."""
+        if win.id == self._root.id:
+            return
+        selected = self._event_masks.get(win.id, 0) | mask
+        self._event_masks[win.id] = selected
+        win.change_attributes(event_mask=selected, onerror=error.CatchError(error.BadWindow))
+
+    def _make_window_info(self, win: Any, visible_only: bool = False) -> WindowInfo | None:
+        """Build WindowInfo for one window, or None if it is filtered out or gone."""
+        try:
+            # Deferred requests are all sent before any reply is read, so they share one
+            # round-trip. With visible_only, attributes go first so unmapped windows stop there.
+            attrs_req = request.GetWindowAttributes(
+                display=self._display.display, defer=True, window=win.id
+            )
+            if visible_only:
+                attrs_req.reply()
+                if attrs_req.map_state != X.IsViewable:
+                    return None
+
+            geom_req = request.GetGeometry(
+                display=self._display.display, defer=True, drawable=win.id
+            )
+            props = self._prop_cache.get(win.id)
+            if props is None:
+                # Hear about changes to this window's properties before reading them,
+                # so an update between the two still drops the cache entry; hear about
+                # its destruction too, so a recycled window id never reuses the entry
+                self._select_events(win, X.PropertyChangeMask | X.StructureNotifyMask)
+                prop_reqs = [
+                    (atom, self._request_property(win, atom, prop_type, length))
+                    for atom, prop_type, length in self._prop_specs
+                ]
+
+            attrs_req.reply()
+            geom_req.reply()
+            if props is None:
+                props = self._decode_window_props(win, prop_reqs)
+                self._prop_cache[win.id] = props
+                if len(self._prop_cache) > _PROP_CACHE_SIZE:
+                    evicted, _ = self._prop_cache.popitem(last=False)
+                    self._event_masks.pop(evicted, None)
+            else:
+                self._prop_cache.move_to_end(win.id)
+            title, class_name, pid = props
+
+            rect = Rect(geom_req.x, geom_req.y, geom_req.width, geom_req.height)
+            return WindowInfo(
+                handle=win.id,
+                title=title,
+                class_name=class_name,
+                pid=pid,
+                process_name="",  # Not easily available
+                rect=rect,
+                client_rect=rect,  # Use same rect for simplicity
+                state=WindowState.NORMAL,  # TODO: detect state properly
+                is_visible=attrs_req.map_state == X.IsViewable,
+                is_active=False,  # Will be determined by caller
+                is_always_on_top=False,  # Not easily detectable
+                opacity=1.0,  # Default opacity
+                display=None,
+            )
+        except Exception:
+            # Typically BadWindow: the window is gone, so its cached properties are too
+            self._forget_window(win.id)
+            return None
+
+    def _forget_window(self, window_id: int) -> None:
+        """Drop the cached properties and tracked event mask of a destroyed window."""
+        self._prop_cache.pop(window_id, None)
+        self._event_masks.pop(window_id, None)
+
+    def _decode_window_props(
+        self, win: Any, prop_reqs: list[tuple[int, Any]]
+    ) -> tuple[str, str, int]:
+        """Decode title, class name and PID from the replies to the _prop_specs requests."""
+        net_name, wm_name, wm_class, net_pid = (
+            self._property_value(win, atom, req) for atom, req in prop_reqs
+        )
+
+        # Get window title
+        try:
+            if net_name is not None:
+                title = net_name.decode("utf-8", errors="ignore")
+            else:
+                title = wm_name.decode("latin1", errors="ignore") if wm_name else ""
+        except Exception:
+            title = ""
+
+        # Get window class
+        try:
+            class_name = (
+                wm_class.decode("latin1", errors="ignore").split("\x00")[1] if wm_class else ""
+            )
+        except Exception:
+            class_name = ""
+
+        # Get PID
+        try:
+            pid = net_pid[0] if net_pid else 0
+        except Exception:
+            pid = 0
+
+        return title, class_name, pid
+
+    def _request_property(self, win: Any, atom: int, prop_type: int, length: int) -> Any:
+        """Send a bounded GetProperty request without waiting for its reply."""
+        return request.GetProperty(
+            display=self._display.display,
+            defer=True,
+            delete=False,
+            window=win.id,
+            property=atom,
+            type=prop_type,
+            long_offset=0,
+            long_length=length,
+        )
+
+    def _property_value(self, win: Any, atom: int, req: Any) -> Any:
+        """Read a deferred GetProperty reply; None if the property is missing."""
+        try:
+            req.reply()
+        except Exception:
+            return None
+        if not req.property_type:
+            return None
+        if req.bytes_after:
+            # Longer than the first read, or stored with another type; fetch the whole value
+            prop = win.get_full_property(atom, X.AnyPropertyType)
+            return prop.value if prop else None
+        return req.value[1]
 
     def get_active_window(self) -> WindowInfo | None:
         """Get active window."""
         try:
-            atom = self._display.intern_atom("_NET_ACTIVE_WINDOW")
+            atom = self._atoms["_NET_ACTIVE_WINDOW"]
             prop = self._root.get_full_property(atom, X.AnyPropertyType)
-            if prop:
-                win_id = prop.value[0]
-                windows = self.list_windows(visible_only=False)
-                for w in windows:
-                    if w.handle == win_id:
-                        return w
+            if prop and prop.value[0]:
+                win = self._display.create_resource_object("window", prop.value[0])
+                self._drain_events()
+                return self._make_window_info(win)
         except Exception:
             pass
         return None
 
     def get_window_at(self, x: int, y: int) -> WindowInfo | None:
         """Get window at position."""
-        # Query pointer to get window at position
-        pointer = self._root.query_pointer()
-        child = pointer.child
-        if child:
-            windows = self.list_windows(visible_only=False)
-            for w in windows:
-                if w.handle == child.id:
-                    return w
-        return None
+        win = None
+        try:
+            win = self._client_window_at(x, y)
+        except Exception:
+            # Fall back to the root child under the pointer
+            win = self._root.query_pointer().child or None
+
+        if win is None:
+            return None
+        self._drain_events()
+        return self._make_window_info(win)
+
+    def _client_window_at(self, x: int, y: int) -> Any:
+        """Find the client window holding a root point, or its top-level frame without one."""
+        # Descend from the root, asking each level which child holds the point, and stop
+        # at the first window carrying WM_STATE: the client, not its frame or a subwindow.
+        # Each level's WM_STATE check and TranslateCoords share one round-trip.
+        atom_wm_state = self._atoms["WM_STATE"]
+        top_level = child = self._root.translate_coords(self._root, x, y).child
+        while child:
+            state_req = self._request_property(child, atom_wm_state, X.AnyPropertyType, 0)
+            coords_req = request.TranslateCoords(
+                display=self._display.display,
+                defer=True,
+                src_wid=self._root.id,
+                dst_wid=child.id,
+                src_x=x,
+                src_y=y,
+            )
+            state_req.reply()
+            coords_req.reply()
+            if state_req.property_type:
+                return child
+            child = coords_req.child
+        # No window manager marked a client; the top-level window is the best match
+        return top_level or None
+
+    def get_window_at_pointer(self) -> WindowInfo | None:
+        """Get window under the pointer."""
+        # Each QueryPointer reply already names the child under the pointer, so the
+        # descent needs no separate position query. Like get_window_at it stops at the
+        # first window carrying WM_STATE, and each level's check shares the round-trip.
+        atom_wm_state = self._atoms["WM_STATE"]
+        win = top_level = None
+        try:
+            top_level = child = self._root.query_pointer().child
+            while child:
+                state_req = self._request_property(child, atom_wm_state, X.AnyPropertyType, 0)
+                pointer_req = request.QueryPointer(
+                    display=self._display.display, defer=True, window=child.id
+                )
+                state_req.reply()
+                pointer_req.reply()
+                if state_req.property_type:
+                    win = child
+                    break
+                child = pointer_req.child
+        except error.XError:
+            pass
+
+        win = win or top_level or None
+        if win is None:
+            return None
+        self._drain_events()
+        return self._make_window_info(win)
 
     def focus_window(self, window: WindowInfo | int) -> None:
         """Focus window."""
@@ -480,6 +863,7 @@ class X11Backend(Backend):
         win.set_input_focus(X.RevertToParent, X.CurrentTime)
         win.configure(stack_mode=X.Above)
         self._safe_sync()
+        self.invalidate_window_cache()
 
     def move_window(self, window: WindowInfo | int, x: int, y: int) -> None:
         """Move window."""
@@ -487,6 +871,7 @@ class X11Backend(Backend):
         win = self._display.create_resource_object("window", handle)
         win.configure(x=x, y=y)
         self._safe_sync()
+        self.invalidate_window_cache()
 
     def resize_window(self, window: WindowInfo | int, width: int, height: int) -> None:
         """Resize window."""
@@ -494,6 +879,7 @@ class X11Backend(Backend):
         win = self._display.create_resource_object("window", handle)
         win.configure(width=width, height=height)
         self._safe_sync()
+        self.invalidate_window_cache()
 
     def set_window_state(self, window: WindowInfo | int, state: WindowState) -> None:
         """Set window state."""
@@ -504,9 +890,9 @@ class X11Backend(Backend):
             win.unmap()
         elif state == WindowState.MAXIMIZED:
             # Send _NET_WM_STATE message
-            atom_state = self._display.intern_atom("_NET_WM_STATE")
-            atom_max_vert = self._display.intern_atom("_NET_WM_STATE_MAXIMIZED_VERT")
-            atom_max_horz = self._display.intern_atom("_NET_WM_STATE_MAXIMIZED_HORZ")
+            atom_state = self._atoms["_NET_WM_STATE"]
+            atom_max_vert = self._atoms["_NET_WM_STATE_MAXIMIZED_VERT"]
+            atom_max_horz = self._atoms["_NET_WM_STATE_MAXIMIZED_HORZ"]
 
             ev = event.ClientMessage(
                 window=win,
@@ -518,6 +904,7 @@ class X11Backend(Backend):
             win.map()
 
         self._safe_sync()
+        self.invalidate_window_cache()
 
     def get_window_state(self, window: WindowInfo | int) -> WindowState:
         """Get window state."""
@@ -530,11 +917,11 @@ class X11Backend(Backend):
                 return WindowState.MINIMIZED
 
             # Check if maximized
-            atom_state = self._display.intern_atom("_NET_WM_STATE")
+            atom_state = self._atoms["_NET_WM_STATE"]
             prop = win.get_full_property(atom_state, X.AnyPropertyType)
             if prop:
-                atom_max_vert = self._display.intern_atom("_NET_WM_STATE_MAXIMIZED_VERT")
-                atom_max_horz = self._display.intern_atom("_NET_WM_STATE_MAXIMIZED_HORZ")
+                atom_max_vert = self._atoms["_NET_WM_STATE_MAXIMIZED_VERT"]
+                atom_max_horz = self._atoms["_NET_WM_STATE_MAXIMIZED_HORZ"]
                 if atom_max_vert in prop.value and atom_max_horz in prop.value:
                     return WindowState.MAXIMIZED
 
@@ -549,8 +936,8 @@ class X11Backend(Backend):
 
         # Try graceful close first
         try:
-            atom_protocols = self._display.intern_atom("WM_PROTOCOLS")
-            atom_delete = self._display.intern_atom("WM_DELETE_WINDOW")
+            atom_protocols = self._atoms["WM_PROTOCOLS"]
+            atom_delete = self._atoms["WM_DELETE_WINDOW"]
 
             ev = event.ClientMessage(
                 window=win,
@@ -563,6 +950,7 @@ class X11Backend(Backend):
             # Force close
             win.destroy()
             self._safe_sync()
+        self.invalidate_window_cache()
 
     def set_window_opacity(self, window: WindowInfo | int, opacity: float) -> None:
         """Set window opacity (0.0-1.0)."""
@@ -570,14 +958,12 @@ class X11Backend(Backend):
         win = self._display.create_resource_object("window", handle)
 
         # _NET_WM_WINDOW_OPACITY atom
-        atom_opacity = self._display.intern_atom("_NET_WM_WINDOW_OPACITY")
+        atom_opacity = self._atoms["_NET_WM_WINDOW_OPACITY"]
 
         # Opacity is 32-bit cardinal, 0xFFFFFFFF = fully opaque
         opacity_value = int(opacity * 0xFFFFFFFF)
 
-        win.change_property(
-            atom_opacity, self._display.intern_atom("CARDINAL"), 32, [opacity_value]
-        )
+        win.change_property(atom_opacity, self._atoms["CARDINAL"], 32, [opacity_value])
         self._safe_sync()
 
     def set_window_always_on_top(self, window: WindowInfo | int, always_on_top: bool) -> None:
@@ -585,8 +971,8 @@ class X11Backend(Backend):
         handle = self._get_window_handle(window)
         win = self._display.create_resource_object("window", handle)
 
-        atom_state = self._display.intern_atom("_NET_WM_STATE")
-        atom_above = self._display.intern_atom("_NET_WM_STATE_ABOVE")
+        atom_state = self._atoms["_NET_WM_STATE"]
+        atom_above = self._atoms["_NET_WM_STATE_ABOVE"]
 
         # 1 = add, 0 = remove
         action = 1 if always_on_top else 0
@@ -600,10 +986,10 @@ class X11Backend(Backend):
     # Clipboard methods
     def clipboard_get_text(self) -> str:
         """Get clipboard text."""
-        atom_clipboard = self._display.intern_atom("CLIPBOARD")
-        atom_utf8 = self._display.intern_atom("UTF8_STRING")
-        atom_string = self._display.intern_atom("STRING")
-        atom_property = self._display.intern_atom("XSEL_DATA")
+        atom_clipboard = self._atoms["CLIPBOARD"]
+        atom_utf8 = self._atoms["UTF8_STRING"]
+        atom_string = self._atoms["STRING"]
+        atom_property = self._atoms["XSEL_DATA"]
 
         # Get current clipboard owner
         owner = self._display.get_selection_owner(atom_clipboard)
@@ -614,9 +1000,8 @@ class X11Backend(Backend):
         # This avoids the complexity of handling SelectionRequest from ourselves
         if hasattr(self, "_clipboard_window") and hasattr(owner, "id"):
             if owner.id == self._clipboard_window.id:
-                if hasattr(self, "_clipboard_text"):
+                with self._clipboard_lock:
                     return self._clipboard_text.decode("utf-8", errors="ignore")
-                return ""
 
         # Request clipboard content to be stored in our root window's property
         self._root.convert_selection(
@@ -627,15 +1012,20 @@ class X11Backend(Backend):
         )
         self._safe_sync()
 
-        # Wait for SelectionNotify event (with timeout)
-        start_time = time.time()
-        timeout = 1.0  # 1 second timeout
+        # Wait for SelectionNotify event (with timeout), blocking on the display socket
+        # instead of polling; already-queued events are drained before each wait
+        deadline = time.monotonic() + 1.0  # 1 second timeout
+        selector = selectors.DefaultSelector()
+        selector.register(self._display.fileno(), selectors.EVENT_READ)
+        try:
+            while True:
+                self._display.pending_events()
+                while self._queued_events():
+                    event_obj = self._display.next_event()
+                    if event_obj.type != X.SelectionNotify:
+                        self._dispatch_event(event_obj)
+                        continue
 
-        while time.time() - start_time < timeout:
-            # Check for pending events
-            if self._display.pending_events() > 0:
-                event_obj = self._display.next_event()
-                if event_obj.type == X.SelectionNotify:
                     # Check if conversion succeeded
                     if event_obj.property == X.NONE:
                         # Conversion failed, try STRING as fallback
@@ -645,78 +1035,124 @@ class X11Backend(Backend):
                         self._safe_sync()
                         continue
 
-                    # Read the property
-                    try:
-                        prop = self._root.get_full_property(atom_property, X.AnyPropertyType)
-                        if prop and prop.value:
-                            # Delete the property after reading
-                            self._root.delete_property(atom_property)
-                            self._safe_sync()
-
-                            # Decode the value
-                            if isinstance(prop.value, bytes):
-                                return prop.value.decode("utf-8", errors="ignore")
-                            return str(prop.value)
-                    except Exception:
-                        pass
+                    return self._read_selection_property(atom_property)
 
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
                     return ""
-            time.sleep(0.01)
+                selector.select(remaining)
+        finally:
+            selector.close()
+
+    def _read_selection_property(self, atom_property: int) -> str:
+        """Read and delete the property a selection was converted into."""
+        try:
+            prop = self._root.get_full_property(atom_property, X.AnyPropertyType)
+            if prop and prop.value:
+                # Delete the property after reading
+                self._root.delete_property(atom_property)
+                self._safe_sync()
+
+                # Decode the value
+                if isinstance(prop.value, bytes):
+                    return prop.value.decode("utf-8", errors="ignore")
+                return str(prop.value)
+        except Exception:
+            pass
 
         return ""
 
     def clipboard_set_text(self, text: str) -> None:
         """Set clipboard text."""
-        atom_clipboard = self._display.intern_atom("CLIPBOARD")
-
-        # Create a window to own the selection if we don't have one
-        if not hasattr(self, "_clipboard_window"):
-            self._clipboard_window = self._root.create_window(0, 0, 1, 1, 0, X.CopyFromParent)
-
-        # Store the text for later retrieval
-        self._clipboard_text = text.encode("utf-8")
-
-        # Take ownership of the CLIPBOARD selection
-        self._clipboard_window.set_selection_owner(atom_clipboard, X.CurrentTime)
-        self._safe_flush()
+        # Store the text the owner thread hands out for later requests
+        with self._clipboard_lock:
+            self._clipboard_text = text.encode("utf-8")
+
+        # Take ownership of the CLIPBOARD selection; the server routes SelectionRequest
+        # events to the connection that owns it, and only the owner thread touches that
+        # connection, so the claim is queued for it and the thread is woken up
+        for _ in range(2):
+            claimed = threading.Event()
+            with self._clipboard_lock:
+                self._ensure_clipboard_owner()
+                self._clipboard_claims.append(claimed)
+                os.write(self._clipboard_wakeup[1], b"\0")
+            if claimed.wait(1.0):
+                return
+            if self._clipboard_thread.is_alive():
+                break
+            # The owner thread died before serving the claim; start a fresh one once
+        raise RuntimeError("Timed out taking ownership of the X11 clipboard")
 
-        # Process pending events to ensure ownership is established
-        # This is important in virtual X11 environments like Xvfb
-        for _ in range(5):
-            if self._display.pending_events() > 0:
-                self._display.next_event()
-            time.sleep(0.01)
+    def _ensure_clipboard_owner(self) -> None:
+        """Start the clipboard owner window and its event thread, again if the thread died.
 
-        # Verify we got the ownership
-        # Note: get_selection_owner() returns a Window resource or X.NONE
-        owner = self._display.get_selection_owner(atom_clipboard)
-        if owner == X.NONE:
-            # No owner - this might be ok in some environments
-            pass
-        elif hasattr(owner, "id"):
-            # Check if we own it (compare window IDs)
-            if owner.id != self._clipboard_window.id:
-                # In Xvfb/headless, ownership might work differently
-                # Log but don't fail - we'll see if selection requests work
+        Called with _clipboard_lock held, so concurrent callers start a single owner.
+        """
+        thread = getattr(self, "_clipboard_thread", None)
+        if thread is not None:
+            if thread.is_alive():
+                return
+            # Release what the dead owner left behind
+            try:
+                self._clipboard_display.close()
+            except Exception:
                 pass
-
-        # Process any immediate selection requests
-        # Note: In a full implementation, we'd need to continuously handle SelectionRequest events
-        # For now, we'll just handle a few immediate requests
-        for _ in range(10):  # Check for up to 10 events
-            if self._display.pending_events() > 0:
-                event_obj = self._display.next_event()
-                if event_obj.type == X.SelectionRequest:
-                    self._handle_selection_request(event_obj)
-            else:
-                break
-            time.sleep(0.01)
+            for fd in self._clipboard_wakeup:
+                os.close(fd)
+
+        # A dedicated connection, so the thread never shares a Display with callers
+        disp = display.Display()
+        self._clipboard_display: Any = disp
+        self._clipboard_window = disp.screen().root.create_window(0, 0, 1, 1, 0, X.CopyFromParent)
+        # Pending ownership claims, each set once the server has processed it
+        self._clipboard_claims: deque[threading.Event] = deque()
+        self._clipboard_wakeup: tuple[int, int] = os.pipe()
+        self._clipboard_thread: threading.Thread = threading.Thread(
+            target=self._clipboard_event_loop,
+            args=(disp, self._clipboard_wakeup[0]),
+            name="guiguigui-x11-clipboard",
+            daemon=True,
+        )
+        self._clipboard_thread.start()
+
+    def _clipboard_event_loop(self, disp: Any, wakeup_fd: int) -> None:
+        """Claim ownership and serve SelectionRequest events for the clipboard owner window."""
+        atom_clipboard = self._atoms["CLIPBOARD"]
+        selector = selectors.DefaultSelector()
+        selector.register(disp.fileno(), selectors.EVENT_READ)
+        selector.register(wakeup_fd, selectors.EVENT_READ)
+        try:
+            while True:
+                try:
+                    while self._clipboard_claims:
+                        claimed = self._clipboard_claims.popleft()
+                        self._clipboard_window.set_selection_owner(atom_clipboard, X.CurrentTime)
+                        disp.sync()
+                        claimed.set()
+                    while disp.pending_events():
+                        event_obj = disp.next_event()
+                        if event_obj.type != X.SelectionRequest:
+                            continue
+                        try:
+                            self._handle_selection_request(event_obj)
+                        except Exception:
+                            # A requestor that went away must not stop the loop
+                            pass
+                    for key, _ in selector.select():
+                        if key.fd == wakeup_fd:
+                            os.read(wakeup_fd, 4096)
+                except Exception:
+                    # Connection closed
+                    return
+        finally:
+            selector.close()
 
     def _handle_selection_request(self, event_obj: Any) -> None:
         """Handle X11 SelectionRequest event."""
-        atom_utf8 = self._display.intern_atom("UTF8_STRING")
-        atom_string = self._display.intern_atom("STRING")
-        atom_targets = self._display.intern_atom("TARGETS")
+        atom_utf8 = self._atoms["UTF8_STRING"]
+        atom_string = self._atoms["STRING"]
+        atom_targets = self._atoms["TARGETS"]
 
         # Create SelectionNotify response
         selection_notify = event.SelectionNotify(
@@ -740,19 +1176,21 @@ class X11Backend(Backend):
         # Handle UTF8_STRING or STRING request
         elif event_obj.target in (atom_utf8, atom_string):
             # Send the clipboard text
+            with self._clipboard_lock:
+                data = self._clipboard_text
             event_obj.requestor.change_property(
                 event_obj.property,
                 event_obj.target,
                 8,  # 8-bit format
-                self._clipboard_text,
+                data,
             )
         else:
             # Unsupported target
             selection_notify.property = X.NONE
 
-        # Send SelectionNotify event back to requestor
+        # Send SelectionNotify event back to requestor, on the owner connection
         event_obj.requestor.send_event(selection_notify)
-        self._safe_sync()
+        self._clipboard_display.flush()
 
     def clipboard_clear(self) -> None:
         """Clear clipboard."""
@@ -766,15 +1204,24 @@ class X11Backend(Backend):
         except Exception:
             return False
 
+    def sync(self) -> None:
+        """Round-trip to the server so every request sent so far has been processed."""
+        self._safe_sync()
+
     # Permission check
     def check_permissions(self) -> dict[str, bool]:
         """Check permissions."""
-        # X11 doesn't have explicit permissions like macOS
-        # Check if we can connect to display
-        return {
-            "mouse": True,
-            "keyboard": True,
-            "window": True,
-            "accessibility": True,
-            "screen_recording": True,
-        }
+        # X11 doesn't have explicit permissions like macOS; being connected is enough,
+        # except that input injection needs XTEST. Neither changes while the connection
+        # is open, so the answer is computed once
+        if self._permissions is None:
+            # Extensions were listed when the connection opened; no round-trip
+            xtest = self._display.has_extension("XTEST")
+            self._permissions = {
+                "mouse": xtest,
+                "keyboard": xtest,
+                "window": True,
+                "accessibility": True,
+                "screen_recording": True,
+            }
+        return dict(self._permissions)
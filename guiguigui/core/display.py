@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+from array import array
+
 from ..backend import get_backend
 from .types import DisplayInfo, Point, Rect
 
@@ -16,6 +18,14 @@ class Display:
         """Alias for all()"""
         return self.all()
 
+    def list_arrays(self) -> tuple[array[int], array[int], array[float]]:
+        """Widths, heights and scales of all displays as packed int32/float64 columns"""
+        displays = self.all()
+        widths = array("i", [d.bounds.width for d in displays])
+        heights = array("i", [d.bounds.height for d in displays])
+        scales = array("d", [d.scale for d in displays])
+        return widths, heights, scales
+
     def primary(self) -> DisplayInfo:
         return self._backend.get_primary_display()
 
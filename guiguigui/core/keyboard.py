@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 import time
-from collections.abc import Generator
+from collections.abc import Generator, Iterable
 from contextlib import contextmanager
 
 from ..backend import get_backend
@@ -26,9 +26,24 @@ class Keyboard:
             if i < times - 1:
                 time.sleep(interval)
 
+    def tap_sequence(self, keys: Iterable[Key | str], interval: float = 0.0) -> None:
+        keys = list(keys)
+        if interval <= 0:
+            self._backend.key_tap_sequence(keys)
+            return
+        for i, key in enumerate(keys):
+            self.tap(key)
+            if i < len(keys) - 1:
+                time.sleep(interval)
+
     def is_pressed(self, key: Key | str) -> bool:
         return self._backend.key_is_pressed(key)
 
+    def query_keymap(self, keys: Iterable[Key | str]) -> dict[Key | str, bool]:
+        """Pressed state of several keys, read from one snapshot where the backend supports it"""
+        keys = list(keys)
+        return dict(zip(keys, self._backend.key_states(keys), strict=True))
+
     def write(self, text: str, interval: float = 0.0) -> None:
         if interval <= 0:
             self._backend.key_type_unicode(text)
@@ -42,18 +57,27 @@ class Keyboard:
         """Alias for write()"""
         self.write(text, interval)
 
+    def type_fast(self, text: str, interval: float = 0.0) -> None:
+        """Type text as one prebuilt event burst where the backend supports it"""
+        self._backend.key_type_batch(text, interval)
+
     def hotkey(self, *keys: Key | str, interval: float = 0.01) -> None:
+        if interval <= 0:
+            # No pacing between keys, so each phase goes out as one burst
+            self._backend.key_press_batch(keys)
+            time.sleep(0.02)
+            self._backend.key_release_batch(keys[::-1])
+            return
+
         for key in keys:
             self.press(key)
-            if interval > 0:
-                time.sleep(interval)
+            time.sleep(interval)
 
         time.sleep(0.02)
 
         for key in reversed(keys):
             self.release(key)
-            if interval > 0:
-                time.sleep(interval)
+            time.sleep(interval)
 
     def press_and_hold(self, key: Key | str, duration: float) -> None:
         self.press(key)
@@ -63,6 +87,13 @@ class Keyboard:
     def get_modifiers(self) -> set[Key]:
         modifiers = set()
         modifier_keys = [Key.SHIFT, Key.CTRL, Key.ALT, Key.CMD, Key.WIN, Key.SUPER]
+        try:
+            # One snapshot for every modifier
+            states = self.query_keymap(modifier_keys)
+            return {key for key in modifier_keys if states[key]}
+        except (KeyError, ValueError):
+            # Some modifier is unknown to this backend; check them one by one
+            pass
         for key in modifier_keys:
             try:
                 if self.is_pressed(key):
@@ -80,13 +111,13 @@ class Keyboard:
         return self.get_layout()
 
     @contextmanager
-    def pressed(self, key: Key | str) -> Generator[None, None, None]:
-        """Context manager to press a key and automatically release it"""
-        self.press(key)
+    def pressed(self, *keys: Key | str) -> Generator[None, None, None]:
+        """Context manager to press keys and automatically release them in reverse order"""
+        self._backend.key_press_batch(keys)
         try:
             yield
         finally:
-            self.release(key)
+            self._backend.key_release_batch(keys[::-1])
 
 
 keyboard = Keyboard()
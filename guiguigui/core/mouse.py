@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import threading
 import time
 from collections.abc import Callable, Generator
 from contextlib import contextmanager
@@ -11,36 +12,79 @@ from .types import MouseButton, Point
 class Mouse:
     def __init__(self):
         self._backend = get_backend()
+        # Serializes per-call coalescing overrides, which live on the shared backend
+        self._coalesce_lock = threading.Lock()
 
     def position(self) -> Point:
         return self._backend.mouse_position()
 
-    def move(
-        self, x: int, y: int, duration: float = 0.0, easing: Callable[[float], float] | None = None
-    ) -> None:
-        if duration <= 0:
-            self._backend.mouse_move_to(x, y)
+    @contextmanager
+    def _coalescing(self, interval: float | None) -> Generator[None, None, None]:
+        if interval is None:
+            yield
             return
+        # Override on the backend instance only, and put back exactly what was there, so
+        # the class default is never touched
+        backend = self._backend
+        with self._coalesce_lock:
+            had_own = "move_coalesce_interval" in vars(backend)
+            previous = backend.move_coalesce_interval
+            backend.move_coalesce_interval = interval
+            try:
+                yield
+            finally:
+                if had_own:
+                    backend.move_coalesce_interval = previous
+                else:
+                    del backend.move_coalesce_interval
 
-        start = self.position()
-        steps = max(int(duration * 60), 2)
-
-        for i in range(steps + 1):
-            t = i / steps
-            if easing:
-                t = easing(t)
-
-            current_x = int(start.x + (x - start.x) * t)
-            current_y = int(start.y + (y - start.y) * t)
-            self._backend.mouse_move_to(current_x, current_y)
-            time.sleep(duration / steps)
-
-    def move_rel(self, dx: int, dy: int, duration: float = 0.0) -> None:
-        if duration <= 0:
-            self._backend.mouse_move_rel(dx, dy)
-        else:
+    def move(
+        self,
+        x: int,
+        y: int,
+        duration: float = 0.0,
+        easing: Callable[[float], float] | None = None,
+        coalesce_interval: float | None = None,
+        return_position: bool = False,
+    ) -> Point | None:
+        with self._coalescing(coalesce_interval):
+            if duration <= 0:
+                if return_position:
+                    return self._backend.mouse_move_and_position(x, y)
+                self._backend.mouse_move_to(x, y)
+                return None
+
+            start = self.position()
+            steps = max(int(duration * 60), 2)
+
+            for i in range(steps + 1):
+                t = i / steps
+                if easing:
+                    t = easing(t)
+
+                current_x = int(start.x + (x - start.x) * t)
+                current_y = int(start.y + (y - start.y) * t)
+                self._backend.mouse_move_to(current_x, current_y)
+                time.sleep(duration / steps)
+
+        return self.position() if return_position else None
+
+    def move_rel(
+        self,
+        dx: int,
+        dy: int,
+        duration: float = 0.0,
+        coalesce_interval: float | None = None,
+        return_position: bool = False,
+    ) -> Point | None:
+        with self._coalescing(coalesce_interval):
+            if duration <= 0 and not return_position:
+                self._backend.mouse_move_rel(dx, dy)
+                return None
             current = self.position()
-            self.move(current.x + dx, current.y + dy, duration)
+            return self.move(
+                current.x + dx, current.y + dy, duration, return_position=return_position
+            )
 
     def click(
         self, button: MouseButton | str = MouseButton.LEFT, clicks: int = 1, interval: float = 0.1
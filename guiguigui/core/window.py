@@ -64,6 +64,10 @@ class Window:
         """Alias for at_point()"""
         return self.at_point(x, y)
 
+    def at_from_pointer(self) -> WindowInfo | None:
+        """Window under the mouse pointer"""
+        return self._backend.get_window_at_pointer()
+
     def focus(self, window: WindowInfo | int) -> None:
         handle = window.handle if isinstance(window, WindowInfo) else window
         self._backend.focus_window(handle)
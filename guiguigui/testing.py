@@ -0,0 +1,8 @@
+from __future__ import annotations
+
+from .backend import get_backend
+
+
+def sync() -> None:
+    """Wait until the backend has processed all input sent so far, instead of sleeping"""
+    get_backend().sync()
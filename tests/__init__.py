@@ -0,0 +1,3 @@
+from tests.xvfb import start_worker_display
+
+start_worker_display()
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from collections.abc import Sequence
 from typing import Any
 
 import pytest
@@ -26,6 +27,9 @@ class MockBackend(Backend):
         self._windows: list[WindowInfo] = []
         self._displays: list[DisplayInfo] = []
         self._active_window: WindowInfo | None = None
+        self._typed_batches: list[tuple[str, float]] = []
+        self._key_batches: list[tuple[str, list[Key | str]]] = []
+        self._key_events: list[tuple[str, Key | str]] = []
 
     def mouse_position(self) -> Point:
         return self._mouse_position
@@ -49,17 +53,30 @@ class MockBackend(Backend):
         return button in self._pressed_buttons
 
     def key_press(self, key: Key | str) -> None:
+        self._key_events.append(("press", key))
         self._pressed_keys.add(key)
 
     def key_release(self, key: Key | str) -> None:
+        self._key_events.append(("release", key))
         self._pressed_keys.discard(key)
 
+    def key_press_batch(self, keys: Sequence[Key | str]) -> None:
+        self._key_batches.append(("press", list(keys)))
+        super().key_press_batch(keys)
+
+    def key_release_batch(self, keys: Sequence[Key | str]) -> None:
+        self._key_batches.append(("release", list(keys)))
+        super().key_release_batch(keys)
+
     def key_is_pressed(self, key: Key | str) -> bool:
         return key in self._pressed_keys
 
     def key_type_unicode(self, text: str) -> None:
         pass
 
+    def key_type_batch(self, text: str, interval: float = 0.0) -> None:
+        self._typed_batches.append((text, interval))
+
     def get_keyboard_layout(self) -> str:
         return "en_US"
 
@@ -0,0 +1,24 @@
+from __future__ import annotations
+
+from collections.abc import Generator
+
+import pytest
+
+from guiguigui.backend import get_backend
+from guiguigui.backend.base import Backend
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _session_backend() -> Backend:
+    # Connect once for the whole session; every guiguigui singleton shares it
+    return get_backend()
+
+
+@pytest.fixture(autouse=True)
+def _backend_reused(_session_backend: Backend) -> Generator[None, None, None]:
+    connection = getattr(_session_backend, "_display", None)
+    fileno = connection.fileno() if connection is not None else None
+    yield
+    assert get_backend() is _session_backend, "backend was recreated during the test"
+    if connection is not None:
+        assert connection.fileno() == fileno, "display connection was reopened"
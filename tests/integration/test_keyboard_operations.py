@@ -7,6 +7,7 @@ import pytest
 
 from guiguigui import keyboard
 from guiguigui.core.types import Key
+from guiguigui.testing import sync
 
 
 @pytest.mark.integration
@@ -14,15 +15,15 @@ class TestKeyboardOperations:
     @pytest.mark.skip(reason="keyboard.is_pressed() not reliable in CI environment")
     def test_key_press_release(self) -> None:
         keyboard.press(Key.SHIFT)
-        time.sleep(0.05)
+        sync()
         assert keyboard.is_pressed(Key.SHIFT)
         keyboard.release(Key.SHIFT)
-        time.sleep(0.05)
+        sync()
         assert not keyboard.is_pressed(Key.SHIFT)
 
     def test_key_tap(self) -> None:
         keyboard.tap(Key.SPACE)
-        time.sleep(0.1)
+        sync()
 
     def test_keyboard_layout(self) -> None:
         layout = keyboard.layout()
@@ -31,14 +32,16 @@ class TestKeyboardOperations:
 
     def test_type_text_ascii(self) -> None:
         keyboard.type("hello", interval=0.01)
-        time.sleep(0.1)
+        # interval=0 sends the whole string to the backend as one batch
+        keyboard.type("hello", interval=0)
+        sync()
 
     @pytest.mark.skipif(
         sys.platform.startswith("linux"), reason="Unicode typing not yet implemented for X11"
     )
     def test_type_text_unicode(self) -> None:
         keyboard.type("你好", interval=0.01)
-        time.sleep(0.1)
+        sync()
 
     def test_hotkey(self) -> None:
         keyboard.hotkey(Key.CTRL, "c", interval=0.01)
@@ -49,26 +52,30 @@ class TestKeyboardOperations:
         modifiers = [Key.SHIFT, Key.CTRL, Key.ALT]
         for mod in modifiers:
             keyboard.press(mod)
-            time.sleep(0.05)
-            assert keyboard.is_pressed(mod)
+            sync()
+            # One snapshot answers for every modifier
+            states = keyboard.query_keymap(modifiers)
+            assert states == {m: m == mod for m in modifiers}
             keyboard.release(mod)
-            time.sleep(0.05)
-            assert not keyboard.is_pressed(mod)
+            sync()
+            assert not any(keyboard.query_keymap(modifiers).values())
+
+    # One test per key, so pytest-xdist can spread them across workers
+    @pytest.mark.parametrize("key", [Key.F1, Key.F12])
+    def test_function_key(self, key: Key) -> None:
+        keyboard.tap(key)
+        sync()
 
-    def test_function_keys(self) -> None:
-        keyboard.tap(Key.F1)
-        time.sleep(0.05)
-        keyboard.tap(Key.F12)
-        time.sleep(0.05)
+    @pytest.mark.parametrize("key", [Key.ENTER, Key.TAB, Key.ESC, Key.BACKSPACE])
+    def test_special_key(self, key: Key) -> None:
+        keyboard.tap(key)
+        sync()
 
-    def test_special_keys(self) -> None:
-        special_keys = [Key.ENTER, Key.TAB, Key.ESC, Key.BACKSPACE]
-        for key in special_keys:
-            keyboard.tap(key)
-            time.sleep(0.05)
+    @pytest.mark.parametrize("key", [Key.LEFT, Key.RIGHT, Key.UP, Key.DOWN])
+    def test_arrow_key(self, key: Key) -> None:
+        keyboard.tap(key)
+        sync()
 
-    def test_arrow_keys(self) -> None:
-        arrow_keys = [Key.LEFT, Key.RIGHT, Key.UP, Key.DOWN]
-        for key in arrow_keys:
-            keyboard.tap(key)
-            time.sleep(0.05)
+    def test_tap_sequence(self) -> None:
+        keyboard.tap_sequence([Key.LEFT, Key.RIGHT, Key.UP, Key.DOWN])
+        sync()
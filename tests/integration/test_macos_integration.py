@@ -11,6 +11,8 @@ import time
 
 import pytest
 
+from guiguigui import clipboard, display, keyboard, mouse, window
+from guiguigui.backend import get_backend
 from guiguigui.core.types import Key, MouseButton, Point
 
 # Only run these tests on macOS with integration marker
@@ -25,8 +27,6 @@ class TestMacOSMouseIntegration:
 
     def test_mouse_move_and_position(self) -> None:
         """Test moving mouse and getting position."""
-        from guiguigui import mouse
-
         # Get current position
         start_pos = mouse.position()
         assert isinstance(start_pos, Point)
@@ -47,8 +47,6 @@ class TestMacOSMouseIntegration:
 
     def test_mouse_relative_move(self) -> None:
         """Test relative mouse movement."""
-        from guiguigui import mouse
-
         start_pos = mouse.position()
 
         # Move relatively
@@ -64,30 +62,22 @@ class TestMacOSMouseIntegration:
 
     def test_mouse_click(self) -> None:
         """Test mouse click operation."""
-        from guiguigui import mouse
-
         # Should not raise exception
         mouse.click()
         time.sleep(0.05)
 
     def test_mouse_double_click(self) -> None:
         """Test double click."""
-        from guiguigui import mouse
-
         mouse.double_click()
         time.sleep(0.05)
 
     def test_mouse_right_click(self) -> None:
         """Test right click."""
-        from guiguigui import mouse
-
         mouse.right_click()
         time.sleep(0.05)
 
     def test_mouse_scroll(self) -> None:
         """Test mouse scroll."""
-        from guiguigui import mouse
-
         # Scroll up and down
         mouse.scroll(dy=3)
         time.sleep(0.05)
@@ -96,8 +86,6 @@ class TestMacOSMouseIntegration:
 
     def test_mouse_drag(self) -> None:
         """Test mouse drag operation."""
-        from guiguigui import mouse
-
         start_pos = mouse.position()
 
         # Perform drag
@@ -109,8 +97,6 @@ class TestMacOSMouseIntegration:
 
     def test_mouse_context_manager(self) -> None:
         """Test mouse pressed context manager."""
-        from guiguigui import mouse
-
         start_pos = mouse.position()
 
         with mouse.pressed(MouseButton.LEFT):
@@ -126,23 +112,17 @@ class TestMacOSKeyboardIntegration:
 
     def test_keyboard_type(self) -> None:
         """Test typing text."""
-        from guiguigui import keyboard
-
         # Type some text
         keyboard.type("test")
         time.sleep(0.1)
 
     def test_keyboard_unicode(self) -> None:
         """Test typing Unicode text."""
-        from guiguigui import keyboard
-
         keyboard.type("中文😌")
         time.sleep(0.1)
 
     def test_keyboard_press_release(self) -> None:
         """Test press and release."""
-        from guiguigui import keyboard
-
         keyboard.press(Key.SHIFT)
         time.sleep(0.05)
         keyboard.release(Key.SHIFT)
@@ -150,31 +130,23 @@ class TestMacOSKeyboardIntegration:
 
     def test_keyboard_tap(self) -> None:
         """Test tap key."""
-        from guiguigui import keyboard
-
         keyboard.tap(Key.SPACE)
         time.sleep(0.05)
 
     def test_keyboard_hotkey(self) -> None:
         """Test hotkey combination."""
-        from guiguigui import keyboard
-
         # Cmd+A (Select All)
         keyboard.hotkey(Key.CMD, Key.A)
         time.sleep(0.1)
 
     def test_keyboard_context_manager(self) -> None:
         """Test keyboard pressed context manager."""
-        from guiguigui import keyboard
-
         with keyboard.pressed(Key.SHIFT):
             keyboard.tap(Key.A)
             time.sleep(0.05)
 
     def test_keyboard_layout(self) -> None:
         """Test getting keyboard layout."""
-        from guiguigui import keyboard
-
         layout = keyboard.layout()
         assert isinstance(layout, str)
         assert len(layout) > 0
@@ -185,8 +157,6 @@ class TestMacOSDisplayIntegration:
 
     def test_display_list(self) -> None:
         """Test listing all displays."""
-        from guiguigui import display
-
         displays = display.list()
         assert len(displays) >= 1
 
@@ -197,8 +167,6 @@ class TestMacOSDisplayIntegration:
 
     def test_display_primary(self) -> None:
         """Test getting primary display."""
-        from guiguigui import display
-
         primary = display.primary()
         assert primary.is_primary is True
         assert primary.bounds.width > 0
@@ -206,8 +174,6 @@ class TestMacOSDisplayIntegration:
 
     def test_display_at_point(self) -> None:
         """Test getting display at point."""
-        from guiguigui import display
-
         primary = display.primary()
         center_x = primary.bounds.width // 2
         center_y = primary.bounds.height // 2
@@ -217,8 +183,6 @@ class TestMacOSDisplayIntegration:
 
     def test_display_virtual_screen(self) -> None:
         """Test virtual screen rect."""
-        from guiguigui import display
-
         rect = display.virtual_screen_rect()
         assert rect.width > 0
         assert rect.height > 0
@@ -229,15 +193,11 @@ class TestMacOSWindowIntegration:
 
     def test_window_list(self) -> None:
         """Test listing windows."""
-        from guiguigui import window
-
         windows = window.list()
         assert isinstance(windows, list)
 
     def test_window_active(self) -> None:
         """Test getting active window."""
-        from guiguigui import window
-
         active = window.active()
         # Might be None, but should not raise
         if active:
@@ -245,8 +205,6 @@ class TestMacOSWindowIntegration:
 
     def test_window_find(self) -> None:
         """Test finding window by title."""
-        from guiguigui import window
-
         # Try to find any window
         result = window.find(title="")
         # Result might be None or a window
@@ -254,8 +212,6 @@ class TestMacOSWindowIntegration:
 
     def test_window_at_mouse(self) -> None:
         """Test getting window at mouse position."""
-        from guiguigui import mouse, window
-
         pos = mouse.position()
         win = window.at(pos.x, pos.y)
 
@@ -269,8 +225,6 @@ class TestMacOSClipboardIntegration:
 
     def test_clipboard_set_get(self) -> None:
         """Test setting and getting clipboard."""
-        from guiguigui import clipboard
-
         # Save original
         original = clipboard.get()
 
@@ -287,8 +241,6 @@ class TestMacOSClipboardIntegration:
 
     def test_clipboard_unicode(self) -> None:
         """Test clipboard with Unicode."""
-        from guiguigui import clipboard
-
         original = clipboard.get()
 
         # Test Unicode
@@ -303,8 +255,6 @@ class TestMacOSClipboardIntegration:
 
     def test_clipboard_has_text(self) -> None:
         """Test checking if clipboard has text."""
-        from guiguigui import clipboard
-
         clipboard.set("test")
         time.sleep(0.05)
 
@@ -312,8 +262,6 @@ class TestMacOSClipboardIntegration:
 
     def test_clipboard_clear(self) -> None:
         """Test clearing clipboard."""
-        from guiguigui import clipboard
-
         original = clipboard.get()
 
         clipboard.set("test")
@@ -331,8 +279,6 @@ class TestMacOSPermissions:
 
     def test_check_permissions(self) -> None:
         """Test checking permissions."""
-        from guiguigui.backend import get_backend
-
         backend = get_backend()
         perms = backend.check_permissions()
 
@@ -351,8 +297,6 @@ class TestMacOSEndToEnd:
 
     def test_complete_workflow(self) -> None:
         """Test a complete workflow using multiple components."""
-        from guiguigui import clipboard, display, keyboard, mouse
-
         # 1. Get display info
         primary = display.primary()
         assert primary.bounds.width > 0
@@ -376,8 +320,6 @@ class TestMacOSEndToEnd:
 
     def test_macro_like_operations(self) -> None:
         """Test macro-like sequence of operations."""
-        from guiguigui import keyboard, mouse
-
         start_pos = mouse.position()
 
         # Move and click
@@ -0,0 +1,35 @@
+from __future__ import annotations
+
+import functools
+from collections.abc import Iterator
+from typing import TYPE_CHECKING
+
+import pytest
+
+if TYPE_CHECKING:
+    from guiguigui.backend.macos import MacOSBackend
+    from guiguigui.backend.x11 import X11Backend
+
+
+@functools.cache
+def session_macos_backend() -> MacOSBackend:
+    # One instance per test process: importing and constructing it loads the Quartz bridges.
+    # Collection hooks that need the backend share it with the fixture below.
+    from guiguigui.backend.macos import MacOSBackend
+
+    return MacOSBackend()
+
+
+@pytest.fixture(scope="session")
+def macos_backend() -> Iterator[MacOSBackend]:
+    backend = session_macos_backend()
+    yield backend
+    backend.close()
+
+
+@pytest.fixture(scope="session")
+def x11_backend() -> X11Backend:
+    # One instance for the session: each construction opens a display connection
+    from guiguigui.backend.x11 import X11Backend
+
+    return X11Backend()
@@ -5,12 +5,79 @@ These tests verify the X11-specific backend logic and methods.
 
 from __future__ import annotations
 
+import os
+import string
 import sys
+import time
 
 import pytest
 
-# Only run these tests on Linux
-pytestmark = pytest.mark.skipif(not sys.platform.startswith("linux"), reason="Linux/X11 only tests")
+from guiguigui.core.types import Key, MouseButton, Rect, WindowState
+
+# Only run these tests on Linux; skip at collection, before the X11 backend is imported
+if not sys.platform.startswith("linux"):
+    pytest.skip("Linux/X11 only tests", allow_module_level=True)
+
+# Skip the whole module once if python-xlib is missing
+X11Backend = pytest.importorskip("guiguigui.backend.x11").X11Backend
+
+_LETTERS = frozenset(string.ascii_lowercase)
+_DIGITS = frozenset(string.digits)
+_FUNCTION_KEYS = frozenset(f"f{i}" for i in range(1, 13))
+
+_REQUIRED_METHODS = frozenset(
+    {
+        # Mouse methods
+        "mouse_position",
+        "mouse_move_to",
+        "mouse_move_rel",
+        "mouse_press",
+        "mouse_release",
+        "mouse_scroll",
+        "mouse_is_pressed",
+        # Keyboard methods
+        "key_press",
+        "key_release",
+        "key_is_pressed",
+        "key_type_unicode",
+        "get_keyboard_layout",
+        # Display methods
+        "get_displays",
+        "get_primary_display",
+        "get_virtual_screen_rect",
+        # Window methods
+        "list_windows",
+        "get_active_window",
+        "get_window_at",
+        "focus_window",
+        "move_window",
+        "resize_window",
+        "set_window_state",
+        "get_window_state",
+        "close_window",
+        "set_window_opacity",
+        "set_window_always_on_top",
+        # Clipboard methods
+        "clipboard_get_text",
+        "clipboard_set_text",
+        "clipboard_clear",
+        "clipboard_has_text",
+        # Permission check
+        "check_permissions",
+    }
+)
+
+
+@pytest.fixture(scope="module")
+def backend(x11_backend: X11Backend) -> X11Backend:
+    """The session backend, under the name the tests in this module use"""
+    return x11_backend
+
+
+@pytest.fixture(scope="module")
+def virtual_screen_rect(backend: X11Backend) -> Rect:
+    """Virtual screen rect read once per module; the test screen layout does not change"""
+    return backend.get_virtual_screen_rect()
 
 
 class TestX11BackendImport:
@@ -29,111 +96,41 @@ class TestX11BackendImport:
         backend = X11Backend()
         assert backend is not None
 
-    def test_backend_has_required_methods(self) -> None:
+    def test_backend_has_required_methods(self, backend: X11Backend) -> None:
         """Test that backend implements all required abstract methods."""
-        from guiguigui.backend.x11 import X11Backend
-
-        backend = X11Backend()
-
-        # Mouse methods
-        assert hasattr(backend, "mouse_position")
-        assert hasattr(backend, "mouse_move_to")
-        assert hasattr(backend, "mouse_move_rel")
-        assert hasattr(backend, "mouse_press")
-        assert hasattr(backend, "mouse_release")
-        assert hasattr(backend, "mouse_scroll")
-        assert hasattr(backend, "mouse_is_pressed")
-
-        # Keyboard methods
-        assert hasattr(backend, "key_press")
-        assert hasattr(backend, "key_release")
-        assert hasattr(backend, "key_is_pressed")
-        assert hasattr(backend, "key_type_unicode")
-        assert hasattr(backend, "get_keyboard_layout")
-
-        # Display methods
-        assert hasattr(backend, "get_displays")
-        assert hasattr(backend, "get_primary_display")
-        assert hasattr(backend, "get_virtual_screen_rect")
-
-        # Window methods
-        assert hasattr(backend, "list_windows")
-        assert hasattr(backend, "get_active_window")
-        assert hasattr(backend, "get_window_at")
-        assert hasattr(backend, "focus_window")
-        assert hasattr(backend, "move_window")
-        assert hasattr(backend, "resize_window")
-        assert hasattr(backend, "set_window_state")
-        assert hasattr(backend, "get_window_state")
-        assert hasattr(backend, "close_window")
-        assert hasattr(backend, "set_window_opacity")
-        assert hasattr(backend, "set_window_always_on_top")
-
-        # Clipboard methods
-        assert hasattr(backend, "clipboard_get_text")
-        assert hasattr(backend, "clipboard_set_text")
-        assert hasattr(backend, "clipboard_clear")
-        assert hasattr(backend, "clipboard_has_text")
-
-        # Permission check
-        assert hasattr(backend, "check_permissions")
+        missing = _REQUIRED_METHODS - set(dir(backend))
+        assert not missing, f"Missing backend methods: {sorted(missing)}"
 
 
 class TestX11KeyMapping:
     """Test key code mapping for X11."""
 
-    def test_key_mapping_exists(self) -> None:
-        """Test that key mapping dictionary exists."""
-        from guiguigui.backend.x11 import X11Backend
+    _COMMON_KEYS = frozenset({"a", "return", "space", "shift", "ctrl", "escape", "delete"})
 
-        backend = X11Backend()
+    def test_key_mapping_exists(self, backend: X11Backend) -> None:
+        """Test that key mapping dictionary exists."""
         # Check that _key_code_map is defined
         assert hasattr(backend, "_key_code_map")
         assert isinstance(backend._key_code_map, dict)
 
-    def test_common_keys_mapped(self) -> None:
+    def test_common_keys_mapped(self, backend: X11Backend) -> None:
         """Test that common keys have mappings."""
-        from guiguigui.backend.x11 import X11Backend
-
-        backend = X11Backend()
-
-        # Test some common keys exist in mapping
-        common_keys = [
-            "a",
-            "return",
-            "space",
-            "shift",
-            "ctrl",
-            "escape",
-            "delete",
-        ]
-
-        for key in common_keys:
-            assert key in backend._key_code_map, f"Key {key} should be in key code map"
+        missing = self._COMMON_KEYS - backend._key_code_map.keys()
+        assert not missing, f"Keys {sorted(missing)} should be in key code map"
 
 
 class TestX11MouseButton:
     """Test mouse button operations for X11."""
 
-    def test_mouse_button_press_release(self) -> None:
+    def test_mouse_button_press_release(self, backend: X11Backend) -> None:
         """Test mouse button press and release operations."""
-        from guiguigui.backend.x11 import X11Backend
-        from guiguigui.core.types import MouseButton
-
-        backend = X11Backend()
-
         # These should not raise exceptions
         # Just test that the methods work
         backend.mouse_press(MouseButton.LEFT)
         backend.mouse_release(MouseButton.LEFT)
 
-    def test_mouse_is_pressed_returns_bool(self) -> None:
+    def test_mouse_is_pressed_returns_bool(self, backend: X11Backend) -> None:
         """Test that mouse_is_pressed returns a boolean."""
-        from guiguigui.backend.x11 import X11Backend
-        from guiguigui.core.types import MouseButton
-
-        backend = X11Backend()
-
         # Should return a boolean for all button types
         result_left = backend.mouse_is_pressed(MouseButton.LEFT)
         result_right = backend.mouse_is_pressed(MouseButton.RIGHT)
@@ -147,11 +144,8 @@ class TestX11MouseButton:
 class TestX11Permissions:
     """Test permission checking on X11."""
 
-    def test_check_permissions_returns_dict(self) -> None:
+    def test_check_permissions_returns_dict(self, backend: X11Backend) -> None:
         """Test that check_permissions returns a dictionary."""
-        from guiguigui.backend.x11 import X11Backend
-
-        backend = X11Backend()
         perms = backend.check_permissions()
 
         assert isinstance(perms, dict)
@@ -161,17 +155,20 @@ class TestX11Permissions:
         assert isinstance(perms["accessibility"], bool)
         assert isinstance(perms["mouse"], bool)
 
+    def test_check_permissions_cached(self, backend: X11Backend) -> None:
+        """Test that check_permissions is computed once and returned as a copy."""
+        perms = backend.check_permissions()
+        perms["mouse"] = not perms["mouse"]
+
+        assert backend.check_permissions() != perms
+        assert backend.check_permissions() == backend.check_permissions()
+
 
 class TestX11Keyboard:
     """Test keyboard operations for X11."""
 
-    def test_key_is_pressed_returns_bool(self) -> None:
+    def test_key_is_pressed_returns_bool(self, backend: X11Backend) -> None:
         """Test that key_is_pressed returns a boolean."""
-        from guiguigui.backend.x11 import X11Backend
-        from guiguigui.core.types import Key
-
-        backend = X11Backend()
-
         # Should return a boolean for various key types
         result_shift = backend.key_is_pressed(Key.SHIFT)
         result_a = backend.key_is_pressed("a")
@@ -185,11 +182,8 @@ class TestX11Keyboard:
 class TestX11KeyboardLayout:
     """Test keyboard layout detection."""
 
-    def test_get_keyboard_layout_returns_string(self) -> None:
+    def test_get_keyboard_layout_returns_string(self, backend: X11Backend) -> None:
         """Test that get_keyboard_layout returns a string."""
-        from guiguigui.backend.x11 import X11Backend
-
-        backend = X11Backend()
         layout = backend.get_keyboard_layout()
 
         assert isinstance(layout, str)
@@ -199,21 +193,15 @@ class TestX11KeyboardLayout:
 class TestX11Display:
     """Test display-related methods."""
 
-    def test_get_displays_returns_list(self) -> None:
+    def test_get_displays_returns_list(self, backend: X11Backend) -> None:
         """Test that get_displays returns a list."""
-        from guiguigui.backend.x11 import X11Backend
-
-        backend = X11Backend()
         displays = backend.get_displays()
 
         assert isinstance(displays, list)
         assert len(displays) > 0
 
-    def test_display_info_structure(self) -> None:
+    def test_display_info_structure(self, backend: X11Backend) -> None:
         """Test that DisplayInfo has correct structure."""
-        from guiguigui.backend.x11 import X11Backend
-
-        backend = X11Backend()
         displays = backend.get_displays()
 
         for display in displays:
@@ -226,21 +214,15 @@ class TestX11Display:
             assert display.bounds.height > 0
             assert display.scale > 0
 
-    def test_get_primary_display(self) -> None:
+    def test_get_primary_display(self, backend: X11Backend) -> None:
         """Test that primary display can be retrieved."""
-        from guiguigui.backend.x11 import X11Backend
-
-        backend = X11Backend()
         primary = backend.get_primary_display()
 
         assert primary is not None
         assert primary.is_primary is True
 
-    def test_virtual_screen_rect(self) -> None:
+    def test_virtual_screen_rect(self, backend: X11Backend) -> None:
         """Test virtual screen rect calculation."""
-        from guiguigui.backend.x11 import X11Backend
-
-        backend = X11Backend()
         rect = backend.get_virtual_screen_rect()
 
         assert rect.width > 0
@@ -250,20 +232,14 @@ class TestX11Display:
 class TestX11Window:
     """Test window-related methods."""
 
-    def test_list_windows_returns_list(self) -> None:
+    def test_list_windows_returns_list(self, backend: X11Backend) -> None:
         """Test that list_windows returns a list."""
-        from guiguigui.backend.x11 import X11Backend
-
-        backend = X11Backend()
         windows = backend.list_windows()
 
         assert isinstance(windows, list)
 
-    def test_get_active_window(self) -> None:
+    def test_get_active_window(self, backend: X11Backend) -> None:
         """Test getting active window."""
-        from guiguigui.backend.x11 import X11Backend
-
-        backend = X11Backend()
         active = backend.get_active_window()
 
         # Might be None if no windows, but should not raise
@@ -271,12 +247,8 @@ class TestX11Window:
             assert hasattr(active, "title")
             assert hasattr(active, "handle")
 
-    def test_window_manipulation_methods(self) -> None:
+    def test_window_manipulation_methods(self, backend: X11Backend) -> None:
         """Test that window manipulation methods work on X11."""
-        from guiguigui.backend.x11 import X11Backend
-        from guiguigui.core.types import WindowState
-
-        backend = X11Backend()
         windows = backend.list_windows()
 
         if not windows:
@@ -299,12 +271,8 @@ class TestX11Window:
             # May fail in Xvfb environment without window manager
             pytest.skip("Window state operations require window manager")
 
-    def test_window_get_at_position(self) -> None:
+    def test_window_get_at_position(self, backend: X11Backend) -> None:
         """Test getting window at position."""
-        from guiguigui.backend.x11 import X11Backend
-
-        backend = X11Backend()
-
         # Get window at current mouse position
         pos = backend.mouse_position()
         window = backend.get_window_at(pos.x, pos.y)
@@ -314,16 +282,80 @@ class TestX11Window:
             assert hasattr(window, "title")
             assert hasattr(window, "handle")
 
+    def test_get_window_at_nested_windows(self, backend: X11Backend) -> None:
+        """Test that get_window_at returns the WM_STATE client, not its frame or subwindow."""
+        from Xlib import X, display
+
+        disp = display.Display()
+        try:
+            root = disp.screen().root
+            # override_redirect keeps a running window manager from reparenting the frame
+            frame = root.create_window(
+                10, 10, 200, 200, 0, X.CopyFromParent, override_redirect=True
+            )
+            client = frame.create_window(0, 0, 200, 200, 0, X.CopyFromParent)
+            inner = client.create_window(0, 0, 200, 200, 0, X.CopyFromParent)
+            atom_wm_state = disp.intern_atom("WM_STATE")
+            client.change_property(atom_wm_state, atom_wm_state, 32, [1, 0])
+            inner.map()
+            client.map()
+            frame.map()
+            frame.configure(stack_mode=X.Above)
+            disp.sync()
+
+            window = backend.get_window_at(50, 50)
+            assert window is not None
+            assert window.handle == client.id
+
+            # Without WM_STATE anywhere the top-level window is returned
+            client.delete_property(atom_wm_state)
+            disp.sync()
+            window = backend.get_window_at(50, 50)
+            assert window is not None
+            assert window.handle == frame.id
+        finally:
+            disp.close()
+
+    def test_destroyed_window_leaves_property_cache(self, backend: X11Backend) -> None:
+        """Test that a destroyed window's cached properties are dropped."""
+        from Xlib import X, display
+
+        disp = display.Display()
+        try:
+            win = disp.screen().root.create_window(0, 0, 10, 10, 0, X.CopyFromParent)
+            win.set_wm_name("guiguigui-destroy-test")
+            disp.sync()
+            handle = win.id
+            info = backend._make_window_info(
+                backend._display.create_resource_object("window", handle)
+            )
+            assert info is not None
+            assert handle in backend._prop_cache
+
+            win.destroy()
+            disp.sync()
+            backend._safe_sync()
+            backend._drain_events()
+            assert handle not in backend._prop_cache
+            assert handle not in backend._event_masks
+        finally:
+            disp.close()
+
+    def test_property_selection_keeps_root_mask(self, backend: X11Backend) -> None:
+        """Test that reading window properties never replaces the root window's event mask."""
+        before = backend._root.get_attributes().your_event_mask
+        backend._prop_cache.clear()
+        backend._make_window_info(backend._root)
+        backend.list_windows(visible_only=False)
+        assert backend._root.get_attributes().your_event_mask == before
+        assert backend._root.id not in backend._event_masks
+
 
 class TestX11EventHooks:
     """Test event hook methods."""
 
-    def test_hook_methods_raise_not_implemented(self) -> None:
+    def test_hook_methods_raise_not_implemented(self, backend: X11Backend) -> None:
         """Test that hook methods raise NotImplementedError."""
-        from guiguigui.backend.x11 import X11Backend
-
-        backend = X11Backend()
-
         # Hook methods should raise NotImplementedError
         with pytest.raises(NotImplementedError):
             backend.hook_mouse(lambda event: True)
@@ -338,13 +370,10 @@ class TestX11EventHooks:
 class TestX11CoordinateSystem:
     """Test coordinate system handling."""
 
-    def test_mouse_position_in_bounds(self) -> None:
+    def test_mouse_position_in_bounds(self, backend: X11Backend, virtual_screen_rect: Rect) -> None:
         """Test that mouse position is within screen bounds."""
-        from guiguigui.backend.x11 import X11Backend
-
-        backend = X11Backend()
         pos = backend.mouse_position()
-        rect = backend.get_virtual_screen_rect()
+        rect = virtual_screen_rect
 
         # Position should be within virtual screen
         assert pos.x >= rect.x
@@ -357,14 +386,8 @@ class TestX11CoordinateSystem:
 class TestX11MouseMovement:
     """Test mouse movement operations for X11."""
 
-    def test_mouse_move_to_executes(self) -> None:
+    def test_mouse_move_to_executes(self, backend: X11Backend) -> None:
         """Test that mouse_move_to moves cursor to target position."""
-        import time
-
-        from guiguigui.backend.x11 import X11Backend
-
-        backend = X11Backend()
-
         # Get starting position to restore later
         start_pos = backend.mouse_position()
 
@@ -384,43 +407,27 @@ class TestX11MouseMovement:
         # Restore original position
         backend.mouse_move_to(start_pos.x, start_pos.y)
 
-    def test_mouse_move_to_with_zero_duration(self) -> None:
+    def test_mouse_move_to_with_zero_duration(self, backend: X11Backend) -> None:
         """Test instant mouse movement."""
-        from guiguigui.backend.x11 import X11Backend
-
-        backend = X11Backend()
-
         # Get starting position
         start_pos = backend.mouse_position()
 
         # Instant move (duration=0.0)
         backend.mouse_move_to(start_pos.x + 10, start_pos.y + 10, duration=0.0)
 
-    def test_mouse_move_rel_executes(self) -> None:
+    def test_mouse_move_rel_executes(self, backend: X11Backend) -> None:
         """Test that mouse_move_rel executes without error."""
-        from guiguigui.backend.x11 import X11Backend
-
-        backend = X11Backend()
-
         # Relative moves should not raise
         backend.mouse_move_rel(10, 10)
         backend.mouse_move_rel(-10, -10)
 
-    def test_mouse_move_to_negative_coordinates(self) -> None:
+    def test_mouse_move_to_negative_coordinates(self, backend: X11Backend) -> None:
         """Test mouse_move_to with negative coordinates."""
-        from guiguigui.backend.x11 import X11Backend
-
-        backend = X11Backend()
-
         # Negative coordinates should not crash (may be clamped)
         backend.mouse_move_to(-100, -100)
 
-    def test_mouse_move_to_large_coordinates(self) -> None:
+    def test_mouse_move_to_large_coordinates(self, backend: X11Backend) -> None:
         """Test mouse_move_to with very large coordinates."""
-        from guiguigui.backend.x11 import X11Backend
-
-        backend = X11Backend()
-
         # Large coordinates should not crash (may be clamped by OS)
         backend.mouse_move_to(10000, 10000)
 
@@ -428,50 +435,30 @@ class TestX11MouseMovement:
 class TestX11MouseScroll:
     """Test mouse scroll operations for X11."""
 
-    def test_mouse_scroll_vertical(self) -> None:
+    def test_mouse_scroll_vertical(self, backend: X11Backend) -> None:
         """Test vertical mouse scroll."""
-        from guiguigui.backend.x11 import X11Backend
-
-        backend = X11Backend()
-
         # Vertical scroll should not raise
         backend.mouse_scroll(0, 5)  # Scroll up
         backend.mouse_scroll(0, -5)  # Scroll down
 
-    def test_mouse_scroll_horizontal(self) -> None:
+    def test_mouse_scroll_horizontal(self, backend: X11Backend) -> None:
         """Test horizontal mouse scroll."""
-        from guiguigui.backend.x11 import X11Backend
-
-        backend = X11Backend()
-
         # Horizontal scroll should not raise
         backend.mouse_scroll(5, 0)  # Scroll right
         backend.mouse_scroll(-5, 0)  # Scroll left
 
-    def test_mouse_scroll_diagonal(self) -> None:
+    def test_mouse_scroll_diagonal(self, backend: X11Backend) -> None:
         """Test diagonal mouse scroll."""
-        from guiguigui.backend.x11 import X11Backend
-
-        backend = X11Backend()
-
         # Diagonal scroll should not raise
         backend.mouse_scroll(3, 3)
 
-    def test_mouse_scroll_zero(self) -> None:
+    def test_mouse_scroll_zero(self, backend: X11Backend) -> None:
         """Test mouse scroll with zero values."""
-        from guiguigui.backend.x11 import X11Backend
-
-        backend = X11Backend()
-
         # Zero scroll should not raise
         backend.mouse_scroll(0, 0)
 
-    def test_mouse_scroll_large_values(self) -> None:
+    def test_mouse_scroll_large_values(self, backend: X11Backend) -> None:
         """Test mouse scroll with large values."""
-        from guiguigui.backend.x11 import X11Backend
-
-        backend = X11Backend()
-
         # Large scroll values should not crash
         backend.mouse_scroll(100, 100)
 
@@ -479,13 +466,8 @@ class TestX11MouseScroll:
 class TestX11KeyboardPressRelease:
     """Test keyboard press and release operations for X11."""
 
-    def test_key_press_release_with_key_enum(self) -> None:
+    def test_key_press_release_with_key_enum(self, backend: X11Backend) -> None:
         """Test key press and release with Key enum."""
-        from guiguigui.backend.x11 import X11Backend
-        from guiguigui.core.types import Key
-
-        backend = X11Backend()
-
         # Press and release should not raise
         backend.key_press(Key.SHIFT)
         backend.key_release(Key.SHIFT)
@@ -493,12 +475,8 @@ class TestX11KeyboardPressRelease:
         backend.key_press(Key.CTRL)
         backend.key_release(Key.CTRL)
 
-    def test_key_press_release_with_string(self) -> None:
+    def test_key_press_release_with_string(self, backend: X11Backend) -> None:
         """Test key press and release with string."""
-        from guiguigui.backend.x11 import X11Backend
-
-        backend = X11Backend()
-
         # Press and release should not raise
         backend.key_press("a")
         backend.key_release("a")
@@ -506,13 +484,8 @@ class TestX11KeyboardPressRelease:
         backend.key_press("1")
         backend.key_release("1")
 
-    def test_key_press_release_special_keys(self) -> None:
+    def test_key_press_release_special_keys(self, backend: X11Backend) -> None:
         """Test special keys press and release."""
-        from guiguigui.backend.x11 import X11Backend
-        from guiguigui.core.types import Key
-
-        backend = X11Backend()
-
         # Test various special keys
         special_keys = [
             Key.ENTER,
@@ -527,13 +500,8 @@ class TestX11KeyboardPressRelease:
             backend.key_press(key)
             backend.key_release(key)
 
-    def test_key_press_release_function_keys(self) -> None:
+    def test_key_press_release_function_keys(self, backend: X11Backend) -> None:
         """Test function keys press and release."""
-        from guiguigui.backend.x11 import X11Backend
-        from guiguigui.core.types import Key
-
-        backend = X11Backend()
-
         # Test F1 and F12
         backend.key_press(Key.F1)
         backend.key_release(Key.F1)
@@ -541,13 +509,8 @@ class TestX11KeyboardPressRelease:
         backend.key_press(Key.F12)
         backend.key_release(Key.F12)
 
-    def test_key_press_release_arrow_keys(self) -> None:
+    def test_key_press_release_arrow_keys(self, backend: X11Backend) -> None:
         """Test arrow keys press and release."""
-        from guiguigui.backend.x11 import X11Backend
-        from guiguigui.core.types import Key
-
-        backend = X11Backend()
-
         # Test all arrow keys
         backend.key_press(Key.UP)
         backend.key_release(Key.UP)
@@ -565,34 +528,22 @@ class TestX11KeyboardPressRelease:
 class TestX11KeyboardTyping:
     """Test keyboard typing operations for X11."""
 
-    def test_key_type_unicode_ascii(self) -> None:
+    def test_key_type_unicode_ascii(self, backend: X11Backend) -> None:
         """Test typing ASCII characters."""
-        from guiguigui.backend.x11 import X11Backend
-
-        backend = X11Backend()
-
         # Should not raise for ASCII
         backend.key_type_unicode("a")
         backend.key_type_unicode("A")
         backend.key_type_unicode("1")
         backend.key_type_unicode("!")
 
-    def test_key_type_unicode_string(self) -> None:
+    def test_key_type_unicode_string(self, backend: X11Backend) -> None:
         """Test typing multi-character string."""
-        from guiguigui.backend.x11 import X11Backend
-
-        backend = X11Backend()
-
         # Should not raise for strings
         backend.key_type_unicode("hello")
         backend.key_type_unicode("Hello World")
 
-    def test_key_type_unicode_unicode(self) -> None:
+    def test_key_type_unicode_unicode(self, backend: X11Backend) -> None:
         """Test typing Unicode characters."""
-        from guiguigui.backend.x11 import X11Backend
-
-        backend = X11Backend()
-
         # Note: Will raise NotImplementedError, but test that it doesn't crash the backend
         try:
             backend.key_type_unicode("你好")
@@ -604,22 +555,14 @@ class TestX11KeyboardTyping:
         except NotImplementedError:
             pass  # Expected for X11
 
-    def test_key_type_unicode_special_chars(self) -> None:
+    def test_key_type_unicode_special_chars(self, backend: X11Backend) -> None:
         """Test typing special characters."""
-        from guiguigui.backend.x11 import X11Backend
-
-        backend = X11Backend()
-
         # Should not raise for special chars
         backend.key_type_unicode("@#$%")
         backend.key_type_unicode("\n\t")
 
-    def test_key_type_unicode_empty_string(self) -> None:
+    def test_key_type_unicode_empty_string(self, backend: X11Backend) -> None:
         """Test typing empty string."""
-        from guiguigui.backend.x11 import X11Backend
-
-        backend = X11Backend()
-
         # Empty string should not raise
         backend.key_type_unicode("")
 
@@ -627,46 +570,26 @@ class TestX11KeyboardTyping:
 class TestX11MouseButtons:
     """Test X11 mouse button operations."""
 
-    def test_mouse_x1_button(self) -> None:
+    def test_mouse_x1_button(self, backend: X11Backend) -> None:
         """Test X1 (back) mouse button."""
-        from guiguigui.backend.x11 import X11Backend
-        from guiguigui.core.types import MouseButton
-
-        backend = X11Backend()
-
         # Should not crash
         backend.mouse_press(MouseButton.X1)
         backend.mouse_release(MouseButton.X1)
 
-    def test_mouse_x2_button(self) -> None:
+    def test_mouse_x2_button(self, backend: X11Backend) -> None:
         """Test X2 (forward) mouse button."""
-        from guiguigui.backend.x11 import X11Backend
-        from guiguigui.core.types import MouseButton
-
-        backend = X11Backend()
-
         # Should not crash
         backend.mouse_press(MouseButton.X2)
         backend.mouse_release(MouseButton.X2)
 
-    def test_mouse_middle_button(self) -> None:
+    def test_mouse_middle_button(self, backend: X11Backend) -> None:
         """Test middle mouse button."""
-        from guiguigui.backend.x11 import X11Backend
-        from guiguigui.core.types import MouseButton
-
-        backend = X11Backend()
-
         # Should not crash
         backend.mouse_press(MouseButton.MIDDLE)
         backend.mouse_release(MouseButton.MIDDLE)
 
-    def test_mouse_is_pressed_all_buttons(self) -> None:
+    def test_mouse_is_pressed_all_buttons(self, backend: X11Backend) -> None:
         """Test mouse_is_pressed for all button types."""
-        from guiguigui.backend.x11 import X11Backend
-        from guiguigui.core.types import MouseButton
-
-        backend = X11Backend()
-
         # Test all buttons (should return bool without crashing)
         for button in [
             MouseButton.LEFT,
@@ -682,34 +605,21 @@ class TestX11MouseButtons:
 class TestX11KeyboardEdgeCases:
     """Test X11 keyboard edge cases."""
 
-    def test_key_is_pressed_with_enum(self) -> None:
+    def test_key_is_pressed_with_enum(self, backend: X11Backend) -> None:
         """Test key_is_pressed with Key enum."""
-        from guiguigui.backend.x11 import X11Backend
-        from guiguigui.core.types import Key
-
-        backend = X11Backend()
-
         # Should not crash with Key enum
         result = backend.key_is_pressed(Key.A)
         assert isinstance(result, bool)
 
-    def test_key_is_pressed_special_keys(self) -> None:
+    def test_key_is_pressed_special_keys(self, backend: X11Backend) -> None:
         """Test key_is_pressed with special keys."""
-        from guiguigui.backend.x11 import X11Backend
-
-        backend = X11Backend()
-
         # Test various special keys
         for key in ["shift", "ctrl", "alt", "enter", "space", "tab"]:
             result = backend.key_is_pressed(key)
             assert isinstance(result, bool)
 
-    def test_key_type_unicode_with_invalid_chars(self) -> None:
+    def test_key_type_unicode_with_invalid_chars(self, backend: X11Backend) -> None:
         """Test key_type_unicode with characters that don't have keycodes."""
-        from guiguigui.backend.x11 import X11Backend
-
-        backend = X11Backend()
-
         # Test with ASCII string containing unmappable characters
         # This should trigger the ValueError catch and skip those chars
         backend.key_type_unicode("`~")  # These might not be mapped
@@ -718,12 +628,8 @@ class TestX11KeyboardEdgeCases:
 class TestX11WindowOperations:
     """Test X11 window operations in detail."""
 
-    def test_list_windows_include_invisible(self) -> None:
+    def test_list_windows_include_invisible(self, backend: X11Backend) -> None:
         """Test listing windows including invisible ones."""
-        from guiguigui.backend.x11 import X11Backend
-
-        backend = X11Backend()
-
         # Get both visible and invisible windows
         all_windows = backend.list_windows(visible_only=False)
         visible_windows = backend.list_windows(visible_only=True)
@@ -731,11 +637,8 @@ class TestX11WindowOperations:
         # All windows should include visible windows
         assert len(all_windows) >= len(visible_windows)
 
-    def test_focus_window_with_window_info(self) -> None:
+    def test_focus_window_with_window_info(self, backend: X11Backend) -> None:
         """Test focus_window with WindowInfo object."""
-        from guiguigui.backend.x11 import X11Backend
-
-        backend = X11Backend()
         windows = backend.list_windows()
 
         if not windows:
@@ -744,22 +647,14 @@ class TestX11WindowOperations:
         # Should work with WindowInfo object
         backend.focus_window(windows[0])
 
-    def test_get_window_at_origin(self) -> None:
+    def test_get_window_at_origin(self, backend: X11Backend) -> None:
         """Test get_window_at at origin (0, 0)."""
-        from guiguigui.backend.x11 import X11Backend
-
-        backend = X11Backend()
-
         # Should return a window or None
         result = backend.get_window_at(0, 0)
         assert result is None or hasattr(result, "handle")
 
-    def test_get_window_at_far_position(self) -> None:
+    def test_get_window_at_far_position(self, backend: X11Backend) -> None:
         """Test get_window_at at a position far from any window."""
-        from guiguigui.backend.x11 import X11Backend
-
-        backend = X11Backend()
-
         # Should return None for position outside screen
         result = backend.get_window_at(10000, 10000)
         assert result is None or hasattr(result, "handle")
@@ -768,32 +663,20 @@ class TestX11WindowOperations:
 class TestX11Clipboard:
     """Test X11 clipboard operations."""
 
-    def test_clipboard_has_text_empty(self) -> None:
+    def test_clipboard_has_text_empty(self, backend: X11Backend) -> None:
         """Test clipboard_has_text when clipboard is empty."""
-        from guiguigui.backend.x11 import X11Backend
-
-        backend = X11Backend()
-
         # Initially should be empty or have content
         # Just test that it doesn't crash
         result = backend.clipboard_has_text()
         assert isinstance(result, bool)
 
-    def test_clipboard_clear(self) -> None:
+    def test_clipboard_clear(self, backend: X11Backend) -> None:
         """Test clipboard_clear method."""
-        from guiguigui.backend.x11 import X11Backend
-
-        backend = X11Backend()
-
         # Clear should not raise
         backend.clipboard_clear()
 
-    def test_clipboard_set_and_has_text(self) -> None:
+    def test_clipboard_set_and_has_text(self, backend: X11Backend) -> None:
         """Test clipboard_set_text and clipboard_has_text."""
-        from guiguigui.backend.x11 import X11Backend
-
-        backend = X11Backend()
-
         # Set text
         backend.clipboard_set_text("test")
 
@@ -801,12 +684,8 @@ class TestX11Clipboard:
         result = backend.clipboard_has_text()
         assert isinstance(result, bool)
 
-    def test_clipboard_get_when_empty(self) -> None:
+    def test_clipboard_get_when_empty(self, backend: X11Backend) -> None:
         """Test clipboard_get_text when clipboard is empty."""
-        from guiguigui.backend.x11 import X11Backend
-
-        backend = X11Backend()
-
         # Clear first
         backend.clipboard_clear()
 
@@ -818,12 +697,8 @@ class TestX11Clipboard:
 class TestX11WindowState:
     """Test X11 window state operations."""
 
-    def test_set_window_state_minimized(self) -> None:
+    def test_set_window_state_minimized(self, backend: X11Backend) -> None:
         """Test setting window to minimized state."""
-        from guiguigui.backend.x11 import X11Backend
-        from guiguigui.core.types import WindowState
-
-        backend = X11Backend()
         windows = backend.list_windows()
 
         if not windows:
@@ -835,12 +710,8 @@ class TestX11WindowState:
         except Exception:
             pass  # Expected in Xvfb
 
-    def test_set_window_state_maximized(self) -> None:
+    def test_set_window_state_maximized(self, backend: X11Backend) -> None:
         """Test setting window to maximized state."""
-        from guiguigui.backend.x11 import X11Backend
-        from guiguigui.core.types import WindowState
-
-        backend = X11Backend()
         windows = backend.list_windows()
 
         if not windows:
@@ -852,11 +723,8 @@ class TestX11WindowState:
         except Exception:
             pass  # Expected in Xvfb
 
-    def test_close_window(self) -> None:
+    def test_close_window(self, backend: X11Backend) -> None:
         """Test closing a window."""
-        from guiguigui.backend.x11 import X11Backend
-
-        backend = X11Backend()
         windows = backend.list_windows()
 
         if not windows:
@@ -872,44 +740,28 @@ class TestX11WindowState:
 class TestX11ErrorHandling:
     """Test X11 backend error handling."""
 
-    def test_invalid_key_press(self) -> None:
+    def test_invalid_key_press(self, backend: X11Backend) -> None:
         """Test pressing an invalid key."""
-        from guiguigui.backend.x11 import X11Backend
-
-        backend = X11Backend()
-
         # Invalid key should raise ValueError
         with pytest.raises(ValueError):
             backend.key_press("invalid_key_name_that_does_not_exist")
 
-    def test_invalid_key_release(self) -> None:
+    def test_invalid_key_release(self, backend: X11Backend) -> None:
         """Test releasing an invalid key."""
-        from guiguigui.backend.x11 import X11Backend
-
-        backend = X11Backend()
-
         # Invalid key should raise ValueError
         with pytest.raises(ValueError):
             backend.key_release("invalid_key_name_that_does_not_exist")
 
-    def test_invalid_mouse_button(self) -> None:
+    def test_invalid_mouse_button(self, backend: X11Backend) -> None:
         """Test with an invalid mouse button."""
-        from guiguigui.backend.x11 import X11Backend
-        from guiguigui.core.types import MouseButton
-
-        backend = X11Backend()
-
         # Create a fake invalid button (this will test the ValueError path)
         # Note: We can't easily create an invalid MouseButton enum value,
         # so we test that valid buttons don't raise
         backend.mouse_press(MouseButton.LEFT)
         backend.mouse_release(MouseButton.LEFT)
 
-    def test_window_with_int_handle(self) -> None:
+    def test_window_with_int_handle(self, backend: X11Backend) -> None:
         """Test window operations with int handle instead of WindowInfo."""
-        from guiguigui.backend.x11 import X11Backend
-
-        backend = X11Backend()
         windows = backend.list_windows()
 
         if not windows:
@@ -925,12 +777,8 @@ class TestX11ErrorHandling:
         backend.move_window(handle, 100, 100)
         backend.resize_window(handle, 400, 300)
 
-    def test_display_fallback_on_randr_error(self) -> None:
+    def test_display_fallback_on_randr_error(self, backend: X11Backend) -> None:
         """Test display detection falls back gracefully on RandR errors."""
-        from guiguigui.backend.x11 import X11Backend
-
-        backend = X11Backend()
-
         # This should work even if RandR has issues
         displays = backend.get_displays()
         assert len(displays) >= 1
@@ -940,11 +788,8 @@ class TestX11ErrorHandling:
 class TestX11DisplayProperties:
     """Test X11 display property access."""
 
-    def test_display_has_bounds(self) -> None:
+    def test_display_has_bounds(self, backend: X11Backend) -> None:
         """Test that displays have bounds."""
-        from guiguigui.backend.x11 import X11Backend
-
-        backend = X11Backend()
         displays = backend.get_displays()
 
         assert len(displays) >= 1
@@ -952,11 +797,8 @@ class TestX11DisplayProperties:
             assert display.bounds.width > 0
             assert display.bounds.height > 0
 
-    def test_display_has_work_area(self) -> None:
+    def test_display_has_work_area(self, backend: X11Backend) -> None:
         """Test that displays have work area."""
-        from guiguigui.backend.x11 import X11Backend
-
-        backend = X11Backend()
         displays = backend.get_displays()
 
         for display in displays:
@@ -964,11 +806,8 @@ class TestX11DisplayProperties:
             assert display.work_area.width > 0
             assert display.work_area.height > 0
 
-    def test_display_has_physical_size(self) -> None:
+    def test_display_has_physical_size(self, backend: X11Backend) -> None:
         """Test that displays have physical size."""
-        from guiguigui.backend.x11 import X11Backend
-
-        backend = X11Backend()
         displays = backend.get_displays()
 
         for display in displays:
@@ -977,29 +816,23 @@ class TestX11DisplayProperties:
             assert display.physical_size.width >= 0
             assert display.physical_size.height >= 0
 
-    def test_virtual_screen_calculation(self) -> None:
+    def test_virtual_screen_calculation(
+        self, backend: X11Backend, virtual_screen_rect: Rect
+    ) -> None:
         """Test virtual screen rect calculation."""
-        from guiguigui.backend.x11 import X11Backend
-
-        backend = X11Backend()
         displays = backend.get_displays()
-        virtual = backend.get_virtual_screen_rect()
+        virtual = virtual_screen_rect
 
         # Virtual screen should encompass all displays
-        for display in displays:
-            assert virtual.x <= display.bounds.x
-            assert virtual.y <= display.bounds.y
+        assert virtual.x <= min((d.bounds.x for d in displays), default=virtual.x)
+        assert virtual.y <= min((d.bounds.y for d in displays), default=virtual.y)
 
 
 class TestX11ClipboardSelectionHandling:
     """Test X11 clipboard selection handling."""
 
-    def test_clipboard_set_creates_window(self) -> None:
+    def test_clipboard_set_creates_window(self, backend: X11Backend) -> None:
         """Test that clipboard_set_text creates a clipboard window."""
-        from guiguigui.backend.x11 import X11Backend
-
-        backend = X11Backend()
-
         # Set text should create clipboard window
         backend.clipboard_set_text("test")
 
@@ -1007,12 +840,8 @@ class TestX11ClipboardSelectionHandling:
         assert hasattr(backend, "_clipboard_window")
         assert hasattr(backend, "_clipboard_text")
 
-    def test_clipboard_get_own_selection(self) -> None:
+    def test_clipboard_get_own_selection(self, backend: X11Backend) -> None:
         """Test getting clipboard text we just set."""
-        from guiguigui.backend.x11 import X11Backend
-
-        backend = X11Backend()
-
         # Set and get our own clipboard
         test_text = "test content 123"
         backend.clipboard_set_text(test_text)
@@ -1021,12 +850,8 @@ class TestX11ClipboardSelectionHandling:
         result = backend.clipboard_get_text()
         assert result == test_text
 
-    def test_clipboard_unicode_content(self) -> None:
+    def test_clipboard_unicode_content(self, backend: X11Backend) -> None:
         """Test clipboard with unicode content."""
-        from guiguigui.backend.x11 import X11Backend
-
-        backend = X11Backend()
-
         # Set unicode text
         test_text = "测试 test テスト"
         backend.clipboard_set_text(test_text)
@@ -1035,46 +860,82 @@ class TestX11ClipboardSelectionHandling:
         result = backend.clipboard_get_text()
         assert result == test_text
 
+    def test_clipboard_set_while_serving_requests(self, backend: X11Backend) -> None:
+        """Test setting the clipboard while another client's request is being served."""
+        from Xlib import X, display
+
+        backend.clipboard_set_text("text -1")
+        requestor = display.Display()
+        try:
+            window = requestor.screen().root.create_window(0, 0, 1, 1, 0, X.CopyFromParent)
+            atom_clipboard = requestor.intern_atom("CLIPBOARD")
+            atom_utf8 = requestor.intern_atom("UTF8_STRING")
+            atom_property = requestor.intern_atom("GUIGUIGUI_TEST_SELECTION")
+            for i in range(20):
+                # Ask for the selection, then replace it before the owner has answered
+                window.convert_selection(atom_clipboard, atom_utf8, atom_property, X.CurrentTime)
+                requestor.flush()
+                backend.clipboard_set_text(f"text {i}")
+
+                notify = None
+                deadline = time.monotonic() + 2.0
+                while notify is None and time.monotonic() < deadline:
+                    while notify is None and requestor.pending_events():
+                        event_obj = requestor.next_event()
+                        if event_obj.type == X.SelectionNotify:
+                            notify = event_obj
+                    time.sleep(0.005)
+                assert notify is not None, f"No SelectionNotify for request {i}"
+                assert notify.property == atom_property
+
+                prop = window.get_full_property(atom_property, X.AnyPropertyType)
+                assert prop is not None
+                assert prop.value.decode() in (f"text {i - 1}", f"text {i}")
+                window.delete_property(atom_property)
+        finally:
+            requestor.close()
+
+        assert backend.clipboard_get_text() == "text 19"
+
+    def test_clipboard_owner_restarts_after_connection_loss(self, backend: X11Backend) -> None:
+        """Test that a dead clipboard owner thread is replaced on the next set."""
+        backend.clipboard_set_text("before")
+        thread = backend._clipboard_thread
+        backend._clipboard_display.close()
+        # Wake the thread so it notices; a closed socket alone may not end its wait
+        os.write(backend._clipboard_wakeup[1], b"\0")
+        thread.join(timeout=2.0)
+        assert not thread.is_alive()
+
+        backend.clipboard_set_text("after")
+        assert backend._clipboard_thread is not thread
+        assert backend._clipboard_thread.is_alive()
+        assert backend.clipboard_get_text() == "after"
+
 
 class TestX11KeyCodeMapping:
     """Test X11 key code mapping."""
 
-    def test_letters_mapped(self) -> None:
+    def test_letters_mapped(self, backend: X11Backend) -> None:
         """Test that all letters are mapped."""
-        from guiguigui.backend.x11 import X11Backend
-
-        backend = X11Backend()
-
         # All lowercase letters should be mapped
-        for char in "abcdefghijklmnopqrstuvwxyz":
-            assert char in backend._key_code_map
+        missing = _LETTERS - backend._key_code_map.keys()
+        assert not missing, f"Unmapped letters: {sorted(missing)}"
 
-    def test_numbers_mapped(self) -> None:
+    def test_numbers_mapped(self, backend: X11Backend) -> None:
         """Test that all numbers are mapped."""
-        from guiguigui.backend.x11 import X11Backend
-
-        backend = X11Backend()
-
         # All numbers should be mapped
-        for num in "0123456789":
-            assert num in backend._key_code_map
+        missing = _DIGITS - backend._key_code_map.keys()
+        assert not missing, f"Unmapped digits: {sorted(missing)}"
 
-    def test_function_keys_mapped(self) -> None:
+    def test_function_keys_mapped(self, backend: X11Backend) -> None:
         """Test that function keys are mapped."""
-        from guiguigui.backend.x11 import X11Backend
-
-        backend = X11Backend()
-
         # Function keys should be mapped
-        for i in range(1, 13):
-            assert f"f{i}" in backend._key_code_map
+        missing = _FUNCTION_KEYS - backend._key_code_map.keys()
+        assert not missing, f"Unmapped function keys: {sorted(missing)}"
 
-    def test_single_char_key_lookup(self) -> None:
+    def test_single_char_key_lookup(self, backend: X11Backend) -> None:
         """Test single character key lookup."""
-        from guiguigui.backend.x11 import X11Backend
-
-        backend = X11Backend()
-
         # Single character keys should work
         backend.key_press("a")
         backend.key_release("a")
@@ -1083,37 +944,23 @@ class TestX11KeyCodeMapping:
 class TestX11MouseMoveDuration:
     """Test X11 mouse movement with duration."""
 
-    def test_mouse_move_zero_duration(self) -> None:
+    def test_mouse_move_zero_duration(self, backend: X11Backend) -> None:
         """Test mouse move with zero duration (instant)."""
-        from guiguigui.backend.x11 import X11Backend
-
-        backend = X11Backend()
-
         # Zero duration should be instant (no interpolation)
         start = backend.mouse_position()
         backend.mouse_move_to(start.x + 100, start.y + 100, duration=0)
 
         # Should complete immediately
 
-    def test_mouse_move_with_small_duration(self) -> None:
+    def test_mouse_move_with_small_duration(self, backend: X11Backend) -> None:
         """Test mouse move with small duration."""
-        import time
-
-        from guiguigui.backend.x11 import X11Backend
-
-        backend = X11Backend()
-
         # Small duration should interpolate
         start = backend.mouse_position()
         backend.mouse_move_to(start.x + 50, start.y + 50, duration=0.1)
 
         time.sleep(0.05)  # Give it time to move
 
-    def test_mouse_move_rel_with_duration(self) -> None:
+    def test_mouse_move_rel_with_duration(self, backend: X11Backend) -> None:
         """Test relative mouse move with duration."""
-        from guiguigui.backend.x11 import X11Backend
-
-        backend = X11Backend()
-
         # Relative move with duration
         backend.mouse_move_rel(20, 20, duration=0.05)
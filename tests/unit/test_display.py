@@ -13,6 +13,13 @@ class TestDisplay:
         assert displays[0].id == "display0"
         assert displays[1].id == "display1"
 
+    def test_list_arrays(self, mock_backend: MockBackend) -> None:
+        display = Display()
+        widths, heights, scales = display.list_arrays()
+        assert list(widths) == [d.bounds.width for d in display.list()]
+        assert list(heights) == [d.bounds.height for d in display.list()]
+        assert list(scales) == [d.scale for d in display.list()]
+
     def test_primary_display(self, mock_backend: MockBackend) -> None:
         display = Display()
         primary = display.primary()
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import pytest
+
 from guiguigui.core.keyboard import Keyboard
 from guiguigui.core.types import Key
 from tests.conftest import MockBackend
@@ -25,6 +27,24 @@ class TestKeyboard:
         keyboard.tap(Key.ENTER)
         assert Key.ENTER not in mock_backend._pressed_keys
 
+    def test_tap_sequence(self, mock_backend: MockBackend) -> None:
+        keyboard = Keyboard()
+        keyboard.tap_sequence([Key.LEFT, Key.RIGHT, "a"])
+        keyboard.tap_sequence([Key.UP, Key.DOWN], interval=0.001)
+        assert mock_backend._key_events == [
+            ("press", Key.LEFT),
+            ("release", Key.LEFT),
+            ("press", Key.RIGHT),
+            ("release", Key.RIGHT),
+            ("press", "a"),
+            ("release", "a"),
+            ("press", Key.UP),
+            ("release", Key.UP),
+            ("press", Key.DOWN),
+            ("release", Key.DOWN),
+        ]
+        assert not mock_backend._pressed_keys
+
     def test_is_pressed(self, mock_backend: MockBackend) -> None:
         keyboard = Keyboard()
         assert not keyboard.is_pressed(Key.SHIFT)
@@ -33,6 +53,22 @@ class TestKeyboard:
         keyboard.release(Key.SHIFT)
         assert not keyboard.is_pressed(Key.SHIFT)
 
+    def test_get_modifiers_skips_unknown_keys(
+        self, mock_backend: MockBackend, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        keyboard = Keyboard()
+        keyboard.press(Key.SHIFT)
+        original = mock_backend.key_is_pressed
+
+        def key_is_pressed(key: Key | str) -> bool:
+            if key == Key.SUPER:
+                raise ValueError(f"Unknown key: {key}")
+            return original(key)
+
+        monkeypatch.setattr(mock_backend, "key_is_pressed", key_is_pressed)
+        assert keyboard.get_modifiers() == {Key.SHIFT}
+        keyboard.release(Key.SHIFT)
+
     def test_type_text(self, mock_backend: MockBackend) -> None:
         keyboard = Keyboard()
         keyboard.type("Hello, World!", interval=0.0)
@@ -41,6 +77,12 @@ class TestKeyboard:
         keyboard = Keyboard()
         keyboard.type("你好世界", interval=0.0)
 
+    def test_type_fast(self, mock_backend: MockBackend) -> None:
+        keyboard = Keyboard()
+        keyboard.type_fast("Hello, World!")
+        keyboard.type_fast("ab", interval=0.001)
+        assert mock_backend._typed_batches == [("Hello, World!", 0.0), ("ab", 0.001)]
+
     def test_hotkey_single_modifier(self, mock_backend: MockBackend) -> None:
         keyboard = Keyboard()
         keyboard.hotkey(Key.CTRL, "c", interval=0.0)
@@ -54,12 +96,35 @@ class TestKeyboard:
         assert Key.SHIFT not in mock_backend._pressed_keys
         assert Key.A not in mock_backend._pressed_keys
 
+    def test_hotkey_burst_order(self, mock_backend: MockBackend) -> None:
+        keyboard = Keyboard()
+        keyboard.hotkey(Key.CTRL, Key.SHIFT, "t", interval=0)
+        assert mock_backend._key_batches == [
+            ("press", [Key.CTRL, Key.SHIFT, "t"]),
+            ("release", ["t", Key.SHIFT, Key.CTRL]),
+        ]
+        assert not mock_backend._pressed_keys
+
     def test_context_manager(self, mock_backend: MockBackend) -> None:
         keyboard = Keyboard()
         with keyboard.pressed(Key.SHIFT):
             assert keyboard.is_pressed(Key.SHIFT)
         assert not keyboard.is_pressed(Key.SHIFT)
 
+    def test_context_manager_multiple_keys(self, mock_backend: MockBackend) -> None:
+        keyboard = Keyboard()
+        with keyboard.pressed(Key.CTRL, Key.SHIFT):
+            assert keyboard.is_pressed(Key.CTRL)
+            assert keyboard.is_pressed(Key.SHIFT)
+        assert not mock_backend._pressed_keys
+
+    def test_query_keymap(self, mock_backend: MockBackend) -> None:
+        keyboard = Keyboard()
+        keyboard.press(Key.SHIFT)
+        assert keyboard.query_keymap([Key.SHIFT, Key.CTRL]) == {Key.SHIFT: True, Key.CTRL: False}
+        keyboard.release(Key.SHIFT)
+        assert keyboard.query_keymap([Key.SHIFT]) == {Key.SHIFT: False}
+
     def test_layout(self, mock_backend: MockBackend) -> None:
         keyboard = Keyboard()
         layout = keyboard.layout()
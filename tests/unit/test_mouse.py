@@ -2,6 +2,9 @@ from __future__ import annotations
 
 import time
 
+import pytest
+
+from guiguigui.backend.base import Backend
 from guiguigui.core.mouse import Mouse
 from guiguigui.core.types import MouseButton, Point
 from tests.conftest import MockBackend
@@ -24,6 +27,53 @@ class TestMouse:
         mouse.move_rel(50, 75)
         assert mock_backend._mouse_position == Point(150, 175)
 
+    def test_move_coalesce_interval_override(
+        self, mock_backend: MockBackend, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        seen: list[float] = []
+        move_to, move_rel = mock_backend.mouse_move_to, mock_backend.mouse_move_rel
+
+        def record_move_to(x: int, y: int) -> None:
+            seen.append(mock_backend.move_coalesce_interval)
+            move_to(x, y)
+
+        def record_move_rel(dx: int, dy: int) -> None:
+            seen.append(mock_backend.move_coalesce_interval)
+            move_rel(dx, dy)
+
+        monkeypatch.setattr(mock_backend, "mouse_move_to", record_move_to)
+        monkeypatch.setattr(mock_backend, "mouse_move_rel", record_move_rel)
+        mouse = Mouse()
+        mouse.move(10, 20, coalesce_interval=0.01)
+        assert mock_backend._mouse_position == Point(10, 20)
+        mouse.move_rel(5, 5, coalesce_interval=0.25)
+        assert mock_backend._mouse_position == Point(15, 25)
+        mouse.move(0, 0)
+        assert seen == [0.01, 0.25, 0.0]
+        # Applied to the instance only and removed afterwards
+        assert "move_coalesce_interval" not in vars(mock_backend)
+        assert Backend.move_coalesce_interval == 0.0
+
+    def test_move_coalesce_interval_restores_instance_value(
+        self, mock_backend: MockBackend
+    ) -> None:
+        mock_backend.move_coalesce_interval = 0.5
+        Mouse().move(10, 20, coalesce_interval=0.01)
+        assert mock_backend.move_coalesce_interval == 0.5
+
+    def test_move_rel_sums_with_coalescing(self, mock_backend: MockBackend) -> None:
+        mouse = Mouse()
+        mock_backend._mouse_position = Point(100, 100)
+        for _ in range(10):
+            mouse.move_rel(1, -1, coalesce_interval=1.0)
+        assert mock_backend._mouse_position == Point(110, 90)
+
+    def test_move_return_position(self, mock_backend: MockBackend) -> None:
+        mouse = Mouse()
+        assert mouse.move(300, 400) is None
+        assert mouse.move(500, 600, return_position=True) == Point(500, 600)
+        assert mouse.move_rel(10, -10, return_position=True) == Point(510, 590)
+
     def test_move_with_duration(self, mock_backend: MockBackend) -> None:
         mouse = Mouse()
         start_time = time.time()
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from guiguigui.core.types import Rect, WindowInfo, WindowState
+from guiguigui.core.types import Point, Rect, WindowInfo, WindowState
 from guiguigui.core.window import Window
 from tests.conftest import MockBackend
 
@@ -224,6 +224,11 @@ class TestWindow:
         assert found is not None
         assert found.title == "Window"
 
+        mock_backend._mouse_position = Point(300, 300)
+        assert window.at_from_pointer() == found
+        mock_backend._mouse_position = Point(0, 0)
+        assert window.at_from_pointer() is None
+
     def test_focus_window(self, mock_backend: MockBackend, sample_window: WindowInfo) -> None:
         window = Window()
         mock_backend._windows = [sample_window]
@@ -0,0 +1,64 @@
+"""Start one Xvfb server per pytest-xdist worker.
+
+Each worker process gets its own virtual display, so tests that move the
+pointer or type keys can run in parallel without seeing each other's input.
+This runs when the tests package is imported, before conftest imports
+guiguigui, whose module-level singletons connect to $DISPLAY immediately.
+"""
+
+from __future__ import annotations
+
+import atexit
+import os
+import select
+import shutil
+import subprocess
+import sys
+
+# gw0 gets :100, gw1 :101, ...; :99 is left for a shared server outside xdist
+_BASE_DISPLAY = 100
+_SCREEN = "1920x1080x24"
+_STARTUP_TIMEOUT = 10.0
+
+
+def start_worker_display() -> None:
+    """Launch Xvfb for this xdist worker and point DISPLAY at it."""
+    worker = os.environ.get("PYTEST_XDIST_WORKER")
+    if not worker or not sys.platform.startswith("linux"):
+        return
+    xvfb = shutil.which("Xvfb")
+    if xvfb is None:
+        return
+
+    number = _BASE_DISPLAY + int(worker.removeprefix("gw"))
+    # Xvfb writes the display number to -displayfd once it accepts clients, and exits
+    # without writing if the display is taken, so a leftover socket file or another
+    # server on the same number is never mistaken for this one being ready
+    read_fd, write_fd = os.pipe()
+    proc = subprocess.Popen(
+        [
+            xvfb,
+            f":{number}",
+            "-displayfd",
+            str(write_fd),
+            "-screen",
+            "0",
+            _SCREEN,
+            "-nolisten",
+            "tcp",
+        ],
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        pass_fds=(write_fd,),
+    )
+    os.close(write_fd)
+    atexit.register(proc.terminate)
+
+    try:
+        readable, _, _ = select.select([read_fd], [], [], _STARTUP_TIMEOUT)
+        announced = os.read(read_fd, 64).strip() if readable else b""
+    finally:
+        os.close(read_fd)
+    if announced != str(number).encode() or proc.poll() is not None:
+        raise RuntimeError(f"Xvfb failed to start on :{number}")
+    os.environ["DISPLAY"] = f":{number}"